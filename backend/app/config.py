@@ -1,7 +1,12 @@
 """Application configuration and constants."""
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+from app.services.keyword_matcher import KeywordMatcher
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -16,6 +21,7 @@ VIDHIMUR_TAGS_FILE = DATA_DIR / "vidhimur_tags.json"   # Our enrichment tags
 # ---------------------------------------------------------------------------
 # Court weights used by the ranking engine (pattern-based)
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=512)
 def get_court_weight(court: str) -> int:
     """Map ANY court name to a weight using pattern matching.
 
@@ -48,7 +54,7 @@ RECENCY_DECAY_RATE = 0.25          # points lost per year of age
 # ---------------------------------------------------------------------------
 # Layer 0 — Query Normalizer: Stopwords
 # ---------------------------------------------------------------------------
-STOPWORDS: set[str] = {
+STOPWORDS: frozenset[str] = frozenset({
     "i", "me", "my", "we", "our", "you", "your", "he", "she", "it", "they",
     "a", "an", "the", "is", "am", "are", "was", "were", "be", "been", "being",
     "have", "has", "had", "do", "does", "did", "will", "would", "shall",
@@ -63,7 +69,7 @@ STOPWORDS: set[str] = {
     "here", "there", "now", "already", "still",
     "refuses", "refused", "want", "wants", "need", "needs",
     "please", "help", "get", "got", "getting",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Layer 0 — Query Normalizer: Legal Synonym Expansion
@@ -107,6 +113,7 @@ LEGAL_SYNONYMS: dict[str, list[str]] = {
 # ---------------------------------------------------------------------------
 # Layer 2 — Authority Filter: Court tiers (pattern-based)
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=512)
 def get_authority_tier(court: str) -> int:
     """Map ANY court name to an authority tier using pattern matching.
 
@@ -165,7 +172,7 @@ RELEVANCE_THRESHOLD = 10.0
 # ---------------------------------------------------------------------------
 # Statute blacklist — patterns to EXCLUDE from relevant_sections
 # ---------------------------------------------------------------------------
-STATUTE_BLACKLIST_PATTERNS: list[str] = [
+STATUTE_BLACKLIST_PATTERNS: frozenset[str] = frozenset({
     "prevention of terrorism",
     "public safety act",
     "sexual harassment",
@@ -183,12 +190,12 @@ STATUTE_BLACKLIST_PATTERNS: list[str] = [
     "constitution of india, article 19",
     "constitution of india, article 21",
     "constitution of india, article 22",
-]
+})
 
 # ---------------------------------------------------------------------------
 # Case exclusion keywords — cases whose summary contains these are excluded
 # ---------------------------------------------------------------------------
-CASE_EXCLUSION_KEYWORDS: list[str] = [
+CASE_EXCLUSION_KEYWORDS: frozenset[str] = frozenset({
     "terrorism",
     "habeas corpus",
     "preventive detention",
@@ -203,17 +210,20 @@ CASE_EXCLUSION_KEYWORDS: list[str] = [
     "trade secrets",
     "micro-credit",
     "self-help group",
-]
+})
 
 # ---------------------------------------------------------------------------
-# Layer 6 — Cache TTL (seconds)
+# Layer 6 — Cache TTL (seconds) and size bounds (LRU eviction beyond these)
 # ---------------------------------------------------------------------------
 CACHE_TTL_SECONDS = 3600  # 1 hour
+CACHE_MAX_DOC_ENTRIES = 4096
+CACHE_MAX_QUERY_ENTRIES = 1024
+CACHE_SWEEP_INTERVAL = 256  # writes between full sweeps of expired entries
 
 # ---------------------------------------------------------------------------
 # Legal issue → category mapping (deterministic classification)
 # ---------------------------------------------------------------------------
-ISSUE_KEYWORDS: dict[str, list[str]] = {
+ISSUE_KEYWORDS: Mapping[str, Sequence[str]] = {
     "Constitutional Law": [
         "fundamental rights", "constitution", "article 14", "article 19",
         "article 21", "right to equality", "free speech", "liberty",
@@ -259,10 +269,19 @@ ISSUE_KEYWORDS: dict[str, list[str]] = {
     ],
 }
 
+# Compiled once at import: one C-level scan finds every ISSUE_KEYWORDS hit
+ISSUE_MATCHER = KeywordMatcher(ISSUE_KEYWORDS)
+
+# Lowercased single-word tokens per area, for O(1) set membership tests
+ISSUE_KEYWORD_TOKENS: Mapping[str, frozenset[str]] = MappingProxyType({
+    area: frozenset(token for kw in keywords for token in kw.lower().split())
+    for area, keywords in ISSUE_KEYWORDS.items()
+})
+
 # ---------------------------------------------------------------------------
 # Action roadmap templates (keyed by legal area)
 # ---------------------------------------------------------------------------
-ACTION_ROADMAPS: dict[str, list[dict[str, str]]] = {
+ACTION_ROADMAPS: Mapping[str, Sequence[Mapping[str, str]]] = {
     "Constitutional Law": [
         {"step": "1", "title": "Document the Violation", "description": "Collect evidence of the fundamental rights violation."},
         {"step": "2", "title": "Consult a Constitutional Lawyer", "description": "Seek legal counsel specializing in constitutional matters."},
@@ -338,9 +357,39 @@ ACTION_ROADMAPS: dict[str, list[dict[str, str]]] = {
 }
 
 # Default roadmap fallback
-DEFAULT_ROADMAP: list[dict[str, str]] = [
+DEFAULT_ROADMAP: Sequence[Mapping[str, str]] = [
     {"step": "1", "title": "Understand Your Rights", "description": "Research the legal provisions applicable to your situation."},
     {"step": "2", "title": "Consult a Lawyer", "description": "Seek professional legal advice from a qualified advocate."},
     {"step": "3", "title": "Send a Legal Notice", "description": "Issue a formal notice to the concerned parties."},
     {"step": "4", "title": "File in Court", "description": "Approach the appropriate court or tribunal for relief."},
 ]
+
+# ---------------------------------------------------------------------------
+# Freeze shared constants — read-only views, safe to hand out per request
+# ---------------------------------------------------------------------------
+def _freeze_roadmap(steps: Sequence[Mapping[str, str]]) -> tuple[Mapping[str, str], ...]:
+    return tuple(MappingProxyType(dict(step)) for step in steps)
+
+
+ISSUE_KEYWORDS = MappingProxyType(
+    {area: tuple(keywords) for area, keywords in ISSUE_KEYWORDS.items()}
+)
+ACTION_ROADMAPS = MappingProxyType(
+    {area: _freeze_roadmap(steps) for area, steps in ACTION_ROADMAPS.items()}
+)
+DEFAULT_ROADMAP = _freeze_roadmap(DEFAULT_ROADMAP)
+
+# ---------------------------------------------------------------------------
+# Pre-rendered action steps (what EmpowerResponse.action_steps carries)
+# ---------------------------------------------------------------------------
+def _render_steps(steps: Sequence[Mapping[str, str]]) -> tuple[str, ...]:
+    return tuple(
+        f"Step {s['step']}: {s['title']} \u2014 {s['description']}"
+        for s in steps
+    )
+
+
+ACTION_STEPS_BY_CATEGORY: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {area: _render_steps(steps) for area, steps in ACTION_ROADMAPS.items()}
+)
+DEFAULT_ACTION_STEPS: tuple[str, ...] = _render_steps(DEFAULT_ROADMAP)
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+
+
+def _err(status: int, code: str, message: str, details: Any = None) -> ORJSONResponse:
+    """Build the shared ``{"error", "message"[, "details"]}`` error envelope."""
+    content: dict[str, Any] = {"error": code, "message": message}
+    if details is not None:
+        content["details"] = details
+    return ORJSONResponse(status_code=status, content=content)
 
 
 def register_error_handlers(app: FastAPI) -> None:
@@ -14,38 +24,19 @@ def register_error_handlers(app: FastAPI) -> None:
     async def validation_error_handler(
         _request: Request,
         exc: RequestValidationError,
-    ) -> JSONResponse:
-        return JSONResponse(
-            status_code=422,
-            content={
-                "error": "validation_error",
-                "message": "Request body validation failed.",
-                "details": exc.errors(),
-            },
-        )
+    ) -> ORJSONResponse:
+        return _err(422, "validation_error", "Request body validation failed.", exc.errors())
 
     @app.exception_handler(FileNotFoundError)
     async def file_not_found_handler(
         _request: Request,
         exc: FileNotFoundError,
-    ) -> JSONResponse:
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "dataset_unavailable",
-                "message": str(exc),
-            },
-        )
+    ) -> ORJSONResponse:
+        return _err(500, "dataset_unavailable", str(exc))
 
     @app.exception_handler(Exception)
     async def general_error_handler(
         _request: Request,
         exc: Exception,
-    ) -> JSONResponse:
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "internal_error",
-                "message": f"An unexpected error occurred: {exc}",
-            },
-        )
+    ) -> ORJSONResponse:
+        return _err(500, "internal_error", f"An unexpected error occurred: {exc}")
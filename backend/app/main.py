@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.errors.handlers import register_error_handlers
 from app.routers import empower, research, ai
@@ -19,6 +20,7 @@ app = FastAPI(
         "Provides deterministic legal case search and citizen empowerment analysis."
     ),
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # ---------------------------------------------------------------------------
@@ -27,13 +29,8 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",   # Create React App / Next.js
-        "http://localhost:5173",   # Vite
-        "http://localhost:5174",   # Vite (alternate port)
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5173",
-    ],
+    # One precompiled match for any localhost / 127.0.0.1 dev-server port
+    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -53,7 +50,11 @@ register_error_handlers(app)
 # Health check
 # ---------------------------------------------------------------------------
 
+# Probes hit this constantly — serve pre-encoded bytes, no per-call encoding
+_HEALTH_BODY = b'{"status":"healthy","service":"VidhimurAI Backend"}'
+
+
 @app.get("/health", tags=["System"])
-async def health_check() -> dict:
+async def health_check() -> Response:
     """Simple liveness probe."""
-    return {"status": "healthy", "service": "VidhimurAI Backend"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
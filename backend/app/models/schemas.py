@@ -1,7 +1,9 @@
-"""Pydantic models for the case data and API request / response contracts."""
+"""Models for the case data (internal) and API request / response contracts (Pydantic)."""
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+
 from pydantic import BaseModel, Field
 
 
@@ -9,8 +11,15 @@ from pydantic import BaseModel, Field
 #  Internal case representation (matches cases.json)
 # ═══════════════════════════════════════════════════════════════════════════
 
-class CaseRecord(BaseModel):
-    """Raw case as stored in the local JSON dataset."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CaseRecord:
+    """Raw case as stored in the local JSON dataset.
+
+    Loaded once and shared by every request, so it is immutable. Built from
+    already-validated adapter models and never serialized, so it is a slotted
+    dataclass rather than a Pydantic model: smaller instances and faster
+    attribute reads in the ranking loops.
+    """
 
     id: str
     kanoon_tid: int | None = None
@@ -19,11 +28,19 @@ class CaseRecord(BaseModel):
     year: int
     citation_count: int
     summary: str
-    keywords: list[str] = Field(default_factory=list)
+    keywords: list[str] = field(default_factory=list)
     outcome: str = ""
-    legal_issues: list[str] = Field(default_factory=list)
-    statutes_referenced: list[str] = Field(default_factory=list)
-    precedents_cited: list[str] = Field(default_factory=list)
+    legal_issues: list[str] = field(default_factory=list)
+    statutes_referenced: list[str] = field(default_factory=list)
+    precedents_cited: list[str] = field(default_factory=list)
+    # Derived once at load time
+    authority_tier: int = 4             # from `court` (see config.get_authority_tier)
+    court_weight: int = 3               # from `court` (see config.get_court_weight)
+    court_lower: str = ""               # court.lower() (court filter)
+    citation_score: float = 0.0         # ranking.citation_score(citation_count)
+    recency_boost: float = 0.0          # ranking.recency_boost(year)
+    summary_blob: str = ""              # f"{summary} {case_name}".lower()
+    search_blob: str = ""               # lowercased name, summary and tags (ranking)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -3,15 +3,22 @@
 Endpoints:
     POST /ai/simplify   — Simplify legal text to layman terms
     POST /ai/translate  — Translate legal text to another language
+    POST /ai/translate/stream — Same, streamed as plain text
     POST /ai/draft      — Generate a legal complaint draft
     POST /ai/roadmap    — Generate a detailed action roadmap
     POST /ai/enhance    — AI-enhanced case summaries and analysis
+    GET  /ai/stats      — LLM response-memo and model-cascade statistics
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.models.schemas import (
     SimplifyRequest, SimplifyResponse,
@@ -29,57 +36,51 @@ _backend_root = Path(__file__).resolve().parent.parent.parent
 if str(_backend_root) not in sys.path:
     sys.path.insert(0, str(_backend_root))
 
-from services.simplifier import Simplifier
-from services.translator import Translator
-from services.draft_generator import DraftGenerator
-from services.roadmap_generator import RoadmapGenerator
-from services.research_ai_enhancer import ResearchAIEnhancer
+if TYPE_CHECKING:
+    from services.simplifier import Simplifier
+    from services.translator import Translator
+    from services.draft_generator import DraftGenerator
+    from services.roadmap_generator import RoadmapGenerator
+    from services.research_ai_enhancer import ResearchAIEnhancer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ai", tags=["AI Services"])
 
-# Lazy-init singletons (created on first request, not at import time)
-_simplifier: Simplifier | None = None
-_translator: Translator | None = None
-_draft_gen: DraftGenerator | None = None
-_roadmap_gen: RoadmapGenerator | None = None
-_enhancer: ResearchAIEnhancer | None = None
-
 
+# Lazy-init singletons (imported and created on first request, not at import
+# time — the LLM stack stays unloaded until an /ai endpoint is actually used).
+# Their calls block on the network, so handlers run them via asyncio.to_thread
+# and concurrent requests (e.g. a page's roadmap + enhance) overlap instead of
+# queueing behind the event loop.
+@lru_cache(maxsize=1)
 def _get_simplifier() -> Simplifier:
-    global _simplifier
-    if _simplifier is None:
-        _simplifier = Simplifier()
-    return _simplifier
+    from services.simplifier import Simplifier
+    return Simplifier()
 
 
+@lru_cache(maxsize=1)
 def _get_translator() -> Translator:
-    global _translator
-    if _translator is None:
-        _translator = Translator()
-    return _translator
+    from services.translator import Translator
+    return Translator()
 
 
+@lru_cache(maxsize=1)
 def _get_draft_gen() -> DraftGenerator:
-    global _draft_gen
-    if _draft_gen is None:
-        _draft_gen = DraftGenerator()
-    return _draft_gen
+    from services.draft_generator import DraftGenerator
+    return DraftGenerator()
 
 
+@lru_cache(maxsize=1)
 def _get_roadmap_gen() -> RoadmapGenerator:
-    global _roadmap_gen
-    if _roadmap_gen is None:
-        _roadmap_gen = RoadmapGenerator()
-    return _roadmap_gen
+    from services.roadmap_generator import RoadmapGenerator
+    return RoadmapGenerator()
 
 
+@lru_cache(maxsize=1)
 def _get_enhancer() -> ResearchAIEnhancer:
-    global _enhancer
-    if _enhancer is None:
-        _enhancer = ResearchAIEnhancer()
-    return _enhancer
+    from services.research_ai_enhancer import ResearchAIEnhancer
+    return ResearchAIEnhancer()
 
 
 # ---------------------------------------------------------------------------
@@ -90,10 +91,10 @@ def _get_enhancer() -> ResearchAIEnhancer:
 async def simplify_text(body: SimplifyRequest) -> SimplifyResponse:
     """Simplify complex legal text into layman-friendly language."""
     try:
-        result = _get_simplifier().simplify(body.legal_summary)
+        result = await asyncio.to_thread(_get_simplifier().simplify, body.legal_summary)
         return SimplifyResponse(simplified_summary=result.get("simplified_summary", ""))
     except Exception as exc:
-        logger.error(f"Simplify error: {exc}")
+        logger.exception("Simplify error: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
@@ -105,12 +106,35 @@ async def simplify_text(body: SimplifyRequest) -> SimplifyResponse:
 async def translate_text(body: TranslateRequest) -> TranslateResponse:
     """Translate legal text into the target language."""
     try:
-        result = _get_translator().translate(body.legal_draft, body.target_language)
+        result = await asyncio.to_thread(
+            _get_translator().translate, body.legal_draft, body.target_language,
+        )
         return TranslateResponse(translated_text=result.get("translated_text", ""))
     except Exception as exc:
-        logger.error(f"Translate error: {exc}")
+        logger.exception("Translate error: %s", exc)
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.post("/translate/stream")
+async def translate_text_stream(body: TranslateRequest) -> StreamingResponse:
+    """Translate legal text, streaming the translation as plain text while it
+    is generated. The generator blocks on the network, so Starlette iterates
+    it on a worker thread."""
+    try:
+        translator = await asyncio.to_thread(_get_translator)
+    except Exception as exc:
+        logger.exception("Translate stream error: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    # Checked before the 200 goes out: once streaming starts, the status is fixed
+    if not translator.llm_service.is_available():
+        raise HTTPException(status_code=503, detail="Translation service unavailable.")
+
+    return StreamingResponse(
+        translator.translate_stream(body.legal_draft, body.target_language),
+        media_type="text/plain; charset=utf-8",
+    )
+
 
 # ---------------------------------------------------------------------------
 # POST /ai/draft
@@ -127,14 +151,14 @@ async def generate_draft(body: DraftRequest) -> DraftResponse:
             "legal_strength": body.legal_strength,
             "action_steps": body.action_steps,
         }
-        result = _get_draft_gen().generate_draft(case_data)
+        result = await asyncio.to_thread(_get_draft_gen().generate_draft, case_data)
         return DraftResponse(
             complaint_title=result.get("complaint_title", ""),
             draft_text=result.get("draft_text", ""),
             recommended_authority=result.get("recommended_authority", ""),
         )
     except Exception as exc:
-        logger.error(f"Draft error: {exc}")
+        logger.exception("Draft error: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
@@ -152,9 +176,9 @@ async def generate_roadmap(body: RoadmapRequest) -> dict:
             "legal_strength": body.legal_strength,
             "action_steps": body.action_steps,
         }
-        return _get_roadmap_gen().generate_roadmap(analysis)
+        return await asyncio.to_thread(_get_roadmap_gen().generate_roadmap, analysis)
     except Exception as exc:
-        logger.error(f"Roadmap error: {exc}")
+        logger.exception("Roadmap error: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
@@ -171,7 +195,19 @@ async def enhance_research(body: EnhanceRequest) -> dict:
             "top_cases": body.top_cases,
             "most_influential_case": body.most_influential_case,
         }
-        return _get_enhancer().enhance_research(research_data)
+        return await asyncio.to_thread(_get_enhancer().enhance_research, research_data)
     except Exception as exc:
-        logger.error(f"Enhance error: {exc}")
+        logger.exception("Enhance error: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+# ---------------------------------------------------------------------------
+# GET /ai/stats
+# ---------------------------------------------------------------------------
+
+@router.get("/stats")
+async def llm_stats() -> dict:
+    """LLM response-memo and simplifier model-cascade statistics."""
+    from services.llm_service import cache_stats
+    from services.simplifier import cascade_stats
+    return {"llm_memo": cache_stats(), "simplify_cascade": cascade_stats()}
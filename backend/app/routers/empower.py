@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.models.schemas import EmpowerRequest, EmpowerResponse
 from app.services.empower import analyze_empowerment
@@ -11,48 +14,62 @@ from app.services.translator import translate_text, translate_batch
 router = APIRouter(prefix="/empower", tags=["Empower"])
 
 
+async def _translate_list(texts: list[str], lang: str) -> list[str]:
+    """Batch-translate off the event loop; empty lists skip the thread hop."""
+    if not texts:
+        return texts
+    return await asyncio.to_thread(translate_batch, texts, lang)
+
+
+async def _translate_response(response: EmpowerResponse, lang: str) -> None:
+    """Translate every user-facing string of ``response`` in place."""
+    precedents = response.precedents
+
+    # Precedent (summary, case_name, court) triples travel as one flat batch
+    precedent_texts: list[str] = []
+    for prec in precedents:
+        precedent_texts += (prec.summary, prec.case_name, prec.court)
+
+    # Independent LLM calls — run them concurrently on the threadpool
+    (
+        issue_type,
+        action_steps,
+        relevant_sections,
+        translated_precedents,
+    ) = await asyncio.gather(
+        asyncio.to_thread(translate_text, response.issue_type, lang),
+        _translate_list(response.action_steps, lang),
+        _translate_list(response.relevant_sections, lang),
+        _translate_list(precedent_texts, lang),
+    )
+
+    response.issue_type = issue_type
+    response.action_steps = action_steps
+    response.relevant_sections = relevant_sections
+    for i, prec in enumerate(precedents):
+        prec.summary, prec.case_name, prec.court = translated_precedents[3 * i:3 * i + 3]
+
+
 @router.post("/analyze", response_model=EmpowerResponse)
-async def empower_analyze(body: EmpowerRequest) -> EmpowerResponse:
+async def empower_analyze(body: EmpowerRequest) -> ORJSONResponse:
     """Analyze a citizen's legal issue: classify, find precedents, assess strength.
 
     Returns structured data consumable by both the frontend and the AI layer.
     Supports optional lang parameter for multilingual results.
     """
+    target_lang = (body.lang or "en").lower()
     try:
-        response = analyze_empowerment(query=body.query, context=body.context)
+        # Off the event loop: an unclassifiable query falls back to a blocking
+        # LLM call (which may also wait on the rate limiter)
+        response = await asyncio.to_thread(analyze_empowerment, body.query, body.context)
 
         # Translate results if non-English language requested
-        if body.lang and body.lang != "en":
-            # Translate issue type
-            response.issue_type = translate_text(response.issue_type, body.lang)
-
-            # Translate action steps in batch
-            if response.action_steps:
-                response.action_steps = translate_batch(response.action_steps, body.lang)
-
-            # Translate relevant sections (statute badges) in batch
-            if response.relevant_sections:
-                response.relevant_sections = translate_batch(response.relevant_sections, body.lang)
-
-            # Translate precedent case names, courts, and summaries
-            if response.precedents:
-                summaries = [p.summary for p in response.precedents]
-                translated_summaries = translate_batch(summaries, body.lang)
-
-                case_names = [p.case_name for p in response.precedents]
-                translated_names = translate_batch(case_names, body.lang)
-
-                courts = [p.court for p in response.precedents]
-                translated_courts = translate_batch(courts, body.lang)
-
-                for prec, t_summary, t_name, t_court in zip(
-                    response.precedents, translated_summaries, translated_names, translated_courts
-                ):
-                    prec.summary = t_summary
-                    prec.case_name = t_name
-                    prec.court = t_court
+        if target_lang != "en":
+            await _translate_response(response, target_lang)
 
-        return response
+        # Already a validated EmpowerResponse — encode it directly instead of
+        # letting FastAPI dump and re-validate it against response_model.
+        return ORJSONResponse(response.model_dump())
     except FileNotFoundError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     except Exception as exc:
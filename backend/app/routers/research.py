@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
 from app.models.schemas import SearchRequest, SearchResponse
@@ -19,32 +21,29 @@ async def research_search(body: SearchRequest) -> SearchResponse:
     Supports optional lang parameter for multilingual results.
     """
     try:
-        response = search_cases(query=body.query, filters=body.filters)
+        # Off the event loop: an unclassifiable query falls back to a blocking
+        # LLM call (which may also wait on the rate limiter)
+        response = await asyncio.to_thread(search_cases, body.query, body.filters)
 
         # Translate results if non-English language requested
         if body.lang and body.lang != "en" and response.top_cases:
-            # Batch translate summaries
-            summaries = [c.summary for c in response.top_cases]
-            translated_summaries = translate_batch(summaries, body.lang)
-
-            # Batch translate case names
-            case_names = [c.case_name for c in response.top_cases]
-            translated_names = translate_batch(case_names, body.lang)
-
-            # Batch translate court names
-            courts = [c.court for c in response.top_cases]
-            translated_courts = translate_batch(courts, body.lang)
-
-            for case, t_summary, t_name, t_court in zip(
-                response.top_cases, translated_summaries, translated_names, translated_courts
-            ):
-                case.summary = t_summary
-                case.case_name = t_name
-                case.court = t_court
-
-            # Also translate the most influential case if present
-            if response.most_influential_case and response.top_cases:
-                response.most_influential_case = response.top_cases[0]
+            cases = list(response.top_cases)
+
+            # The most influential case is normally top_cases[0] itself; only
+            # a distinct object needs its own slot in the batch
+            mic = response.most_influential_case
+            if mic is not None and not any(mic is case for case in cases):
+                cases.append(mic)
+
+            # One pass: (summary, case_name, court) per case, interleaved, in
+            # one translator round-trip run off the event loop
+            texts: list[str] = []
+            for case in cases:
+                texts += (case.summary, case.case_name, case.court)
+            translated = await asyncio.to_thread(translate_batch, texts, body.lang)
+
+            for i, case in enumerate(cases):
+                case.summary, case.case_name, case.court = translated[3 * i:3 * i + 3]
 
         return response
     except FileNotFoundError as exc:
@@ -9,9 +9,12 @@ outcome) — no LLM required.
 from __future__ import annotations
 
 import re
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
 
-from app.config import ISSUE_KEYWORDS, STOPWORDS
+from app.config import ISSUE_KEYWORDS, ISSUE_KEYWORD_TOKENS, STOPWORDS
+from app.services.keyword_matcher import KeywordMatcher
 
 # ---------------------------------------------------------------------------
 # Statute extraction patterns
@@ -29,6 +32,14 @@ _SECTION_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Splits a matched list like "14, 19 and 21" into its individual numbers
+_LIST_SPLIT_RE = re.compile(r"\s*,\s*|\s+and\s+")
+
+# Interned "Constitution of India, Article X" / "Section X" refs, built lazily
+# so repeat citations across a corpus share one string object
+_ARTICLE_REF_CACHE: dict[str, str] = {}
+_SECTION_REF_CACHE: dict[str, str] = {}
+
 # Matches: "XXXXX Act, YYYY" or "XXXXX Act YYYY" — limited to reasonable length
 _ACT_RE = re.compile(
     r"\b((?:(?:the|of|for)\s+)?[A-Z][a-zA-Z\s&()]{3,55}?(?:Act|Code|Rules|Procedure|Regulation)\s*,?\s*\d{4})",
@@ -212,6 +223,57 @@ _CONTEXT_STATUTES: dict[str, list[str]] = {
     ],
 }
 
+# ---------------------------------------------------------------------------
+# Sub-issue detection: phrase → specific legal issue
+# ---------------------------------------------------------------------------
+_SUB_ISSUES: dict[str, str] = {
+    "basic structure doctrine": "Basic structure doctrine",
+    "basic structure": "Basic structure doctrine",
+    "right to life": "Right to life and personal liberty",
+    "right to privacy": "Right to privacy",
+    "right to equality": "Right to equality",
+    "sexual harassment": "Sexual harassment at workplace",
+    "domestic violence": "Domestic violence",
+    "medical negligence": "Medical negligence",
+    "wrongful termination": "Wrongful termination",
+    "preventive detention": "Preventive detention",
+    "environmental clearance": "Environmental clearance",
+    "data protection": "Data protection",
+    "consumer complaint": "Consumer rights dispute",
+    "bail application": "Bail jurisprudence",
+    "eviction": "Tenant eviction",
+    "divorce": "Matrimonial dispute",
+    "custody": "Child custody",
+    "customs duty": "Customs/tariff dispute",
+    "customs assessment": "Customs/tariff dispute",
+    "imported goods": "Customs/tariff dispute",
+    "retrenchment": "Industrial labor dispute",
+    "pension": "Social welfare / pension",
+    "widow pension": "Social welfare / pension rights",
+    "habeas corpus": "Habeas corpus / personal liberty",
+    "unauthorized construction": "Property / construction dispute",
+    "demolition": "Property / construction dispute",
+    "cheating and forgery": "Criminal fraud",
+    "cheating": "Criminal fraud",
+    "data localization": "Data governance",
+    "micro-credit": "Financial inclusion",
+    "self-help group": "Financial inclusion",
+    "homosexual": "LGBTQ+ rights",
+    "section 377": "Decriminalization of homosexuality",
+    "decriminalized": "LGBTQ+ rights",
+    "protection order": "Domestic violence / protection orders",
+    "trade secrets": "Trade secret misappropriation",
+    "hacking": "Cyber crime",
+    "unauthorized access": "Cyber crime",
+    "terrorism": "Terrorism / national security",
+    "conspiracy": "Criminal conspiracy",
+    "defective": "Consumer - defective product",
+    "delayed possession": "Consumer - delayed delivery",
+    "medical negligence": "Medical negligence / standard of care",
+    "pollution clearance": "Environmental violation",
+    "forest": "Forest conservation",
+}
+
 # ---------------------------------------------------------------------------
 # Outcome detection patterns
 # ---------------------------------------------------------------------------
@@ -233,13 +295,18 @@ _OUTCOME_PATTERNS: list[tuple[str, str]] = [
     (r"closure\s+ordered", "closure ordered"),
 ]
 
+# All outcome patterns in one zero-width alternation: a single scan reports,
+# at every position, the highest-priority pattern starting there (group g<i>).
+_OUTCOME_RE = re.compile(
+    "(?=" + "|".join(f"(?P<g{i}>{pat})" for i, (pat, _) in enumerate(_OUTCOME_PATTERNS)) + ")",
+    re.IGNORECASE,
+)
+_OUTCOME_LABELS: list[str] = [label for _, label in _OUTCOME_PATTERNS]
+
 # ---------------------------------------------------------------------------
 # Legal-domain single-word vocabulary
 # ---------------------------------------------------------------------------
-_LEGAL_VOCAB: set[str] = set()
-for _keywords in ISSUE_KEYWORDS.values():
-    for kw in _keywords:
-        _LEGAL_VOCAB.update(kw.lower().split())
+_LEGAL_VOCAB: set[str] = set().union(*ISSUE_KEYWORD_TOKENS.values())
 
 _LEGAL_VOCAB.update({
     "constitution", "constitutional", "fundamental", "writ", "petition",
@@ -293,8 +360,22 @@ _PHRASES: list[str] = [
     "delayed possession", "writ petition",
 ]
 
+# Compiled once at import — keyword extraction is two C-level scans per text
+_TOKEN_RE = re.compile(r"[a-zA-Z]+")
+_KEYWORD_VOCAB: frozenset[str] = frozenset(
+    w for w in _LEGAL_VOCAB if w not in STOPWORDS and len(w) > 2
+)
+_PHRASE_MATCHER = KeywordMatcher({"phrase": _PHRASES})
+_PHRASE_RANK: dict[str, int] = {phrase: i for i, phrase in enumerate(_PHRASES)}
+_STATUTE_MATCHER = KeywordMatcher({"shorthand": _STATUTE_KEYWORDS})
+_CONTEXT_MATCHER = KeywordMatcher({"context": _CONTEXT_STATUTES})
+
+# Issue categories and sub-issue phrases share one scan of the text
+_SUB_ISSUE_LABEL = "__sub_issue__"
+_ISSUE_SCANNER = KeywordMatcher({**ISSUE_KEYWORDS, _SUB_ISSUE_LABEL: _SUB_ISSUES})
 
-@dataclass
+
+@dataclass(slots=True)
 class AutoTags:
     """Generated tags for a single case."""
     keywords: list[str] = field(default_factory=list)
@@ -319,55 +400,69 @@ def generate_tags(
 ) -> AutoTags:
     """Generate enrichment tags from raw case data."""
     text = f"{title} {headline}"
-    full_text = f"{text} {' '.join(cite_titles or [])}"
+    cites = " ".join(cite_titles or ())
+    full_text = f"{text} {cites}"
 
-    tags = AutoTags()
-    tags.keywords = _extract_keywords(text, docsource)
-    tags.outcome = _infer_outcome(headline)
-    tags.legal_issues = _detect_legal_issues(full_text)
-    tags.statutes_referenced = _extract_statutes(full_text)
+    # Lowercase once for the whole pipeline
+    text_lower = text.lower()
+    full_lower = f"{text_lower} {cites.lower()}"
 
-    return tags
+    return AutoTags(
+        keywords=_extract_keywords(text_lower, docsource),
+        outcome=_infer_outcome(headline),
+        legal_issues=_detect_legal_issues(full_lower),
+        statutes_referenced=_extract_statutes(full_text, full_lower),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Internal extraction functions
 # ---------------------------------------------------------------------------
 
-def _extract_keywords(text: str, docsource: str = "") -> list[str]:
-    """Extract domain-relevant keywords from text using vocabulary matching."""
-    tokens = re.findall(r"[a-zA-Z]+", text.lower())
-
-    seen: set[str] = set()
-    keywords: list[str] = []
-
-    # Single-word matches
-    for token in tokens:
-        if token in STOPWORDS or len(token) <= 2 or token in seen:
-            continue
-        if token in _LEGAL_VOCAB:
-            keywords.append(token)
-            seen.add(token)
+def _extract_keywords(text_lower: str, docsource: str = "") -> list[str]:
+    """Extract domain-relevant keywords from lowercased text using vocabulary matching."""
+    # Single-word matches, first occurrence order (dict.fromkeys de-duplicates;
+    # the vocabulary already excludes stopwords and tokens of <= 2 letters)
+    keywords = list(filter(
+        _KEYWORD_VOCAB.__contains__, dict.fromkeys(_TOKEN_RE.findall(text_lower)),
+    ))
+    if len(keywords) >= 12:
+        return keywords[:12]   # phrases would all fall past the cut
 
-    # Multi-word phrase matches
-    text_lower = text.lower()
-    for phrase in _PHRASES:
-        if phrase in text_lower and phrase not in seen:
-            keywords.append(phrase)
-            seen.add(phrase)
+    # Multi-word phrase matches, in _PHRASES order (sort the few hits rather
+    # than walking the whole phrase list)
+    keywords += sorted(_PHRASE_MATCHER.keywords(text_lower), key=_PHRASE_RANK.__getitem__)
 
     return keywords[:12]
 
 
 def _infer_outcome(headline: str) -> str:
-    """Infer case outcome from headline text using pattern matching."""
-    for pattern, label in _OUTCOME_PATTERNS:
-        if re.search(pattern, headline, re.IGNORECASE):
-            sentences = re.split(r"[.;]", headline)
-            for sent in sentences:
-                if re.search(pattern, sent, re.IGNORECASE):
-                    return sent.strip().rstrip(".")
-            return label
+    """Infer case outcome from headline text using pattern matching.
+
+    The earliest-listed pattern that occurs anywhere wins; the result is the
+    first sentence containing it, or its label if every hit straddles a
+    sentence break (e.g. "Rs.").
+    """
+    best: int | None = None
+    first_in_sentence: dict[int, int] = {}   # pattern index → match offset
+    for m in _OUTCOME_RE.finditer(headline):
+        name = m.lastgroup
+        idx = int(name[1:])
+        if best is None or idx < best:
+            best = idx
+        if idx not in first_in_sentence:
+            matched = m.group(name)
+            if "." not in matched and ";" not in matched:
+                first_in_sentence[idx] = m.start()
+
+    if best is not None:
+        pos = first_in_sentence.get(best)
+        if pos is None:
+            return _OUTCOME_LABELS[best]
+        start = max(headline.rfind(".", 0, pos), headline.rfind(";", 0, pos)) + 1
+        ends = [i for i in (headline.find(".", pos), headline.find(";", pos)) if i != -1]
+        end = min(ends) if ends else len(headline)
+        return headline[start:end].strip().rstrip(".")
 
     # Fallback: last sentence
     sentences = [s.strip() for s in headline.rstrip(".").split(".") if s.strip()]
@@ -376,88 +471,48 @@ def _infer_outcome(headline: str) -> str:
     return "Outcome not determinable from headline"
 
 
-def _detect_legal_issues(text: str) -> list[str]:
-    """Detect legal issues by matching against ISSUE_KEYWORDS."""
-    text_lower = text.lower()
-    issues: list[str] = []
+def _detect_legal_issues(text_lower: str) -> list[str]:
+    """Detect legal issues by matching lowercased text against ISSUE_KEYWORDS and _SUB_ISSUES."""
+    category_hits: Counter[str] = Counter()
+    sub_issue_hits: set[str] = set()
+    for label, keyword in _ISSUE_SCANNER.hits(text_lower):
+        if label == _SUB_ISSUE_LABEL:
+            sub_issue_hits.add(keyword)
+        else:
+            category_hits[label] += 1
 
-    for category, keywords in ISSUE_KEYWORDS.items():
-        match_count = sum(1 for kw in keywords if kw in text_lower)
-        if match_count >= 2:
-            issues.append(category)
+    issues = [category for category in ISSUE_KEYWORDS if category_hits[category] >= 2]
 
     # Sub-issue detection
-    _SUB_ISSUES = {
-        "basic structure doctrine": "Basic structure doctrine",
-        "basic structure": "Basic structure doctrine",
-        "right to life": "Right to life and personal liberty",
-        "right to privacy": "Right to privacy",
-        "right to equality": "Right to equality",
-        "sexual harassment": "Sexual harassment at workplace",
-        "domestic violence": "Domestic violence",
-        "medical negligence": "Medical negligence",
-        "wrongful termination": "Wrongful termination",
-        "preventive detention": "Preventive detention",
-        "environmental clearance": "Environmental clearance",
-        "data protection": "Data protection",
-        "consumer complaint": "Consumer rights dispute",
-        "bail application": "Bail jurisprudence",
-        "eviction": "Tenant eviction",
-        "divorce": "Matrimonial dispute",
-        "custody": "Child custody",
-        "customs duty": "Customs/tariff dispute",
-        "customs assessment": "Customs/tariff dispute",
-        "imported goods": "Customs/tariff dispute",
-        "retrenchment": "Industrial labor dispute",
-        "pension": "Social welfare / pension",
-        "widow pension": "Social welfare / pension rights",
-        "habeas corpus": "Habeas corpus / personal liberty",
-        "unauthorized construction": "Property / construction dispute",
-        "demolition": "Property / construction dispute",
-        "cheating and forgery": "Criminal fraud",
-        "cheating": "Criminal fraud",
-        "data localization": "Data governance",
-        "micro-credit": "Financial inclusion",
-        "self-help group": "Financial inclusion",
-        "homosexual": "LGBTQ+ rights",
-        "section 377": "Decriminalization of homosexuality",
-        "decriminalized": "LGBTQ+ rights",
-        "protection order": "Domestic violence / protection orders",
-        "trade secrets": "Trade secret misappropriation",
-        "hacking": "Cyber crime",
-        "unauthorized access": "Cyber crime",
-        "terrorism": "Terrorism / national security",
-        "conspiracy": "Criminal conspiracy",
-        "defective": "Consumer - defective product",
-        "delayed possession": "Consumer - delayed delivery",
-        "medical negligence": "Medical negligence / standard of care",
-        "pollution clearance": "Environmental violation",
-        "forest": "Forest conservation",
-    }
-
     for pattern, issue in _SUB_ISSUES.items():
-        if pattern in text_lower and issue not in issues:
+        if pattern in sub_issue_hits and issue not in issues:
             issues.append(issue)
 
     return issues[:5]
 
 
-def _extract_statutes(text: str) -> list[str]:
-    """Extract statute references using regex, shorthands, and context inference."""
+def _extract_statutes(text: str, text_lower: str) -> list[str]:
+    """Extract statute references using regex, shorthands, and context inference.
+
+    The regexes need the original casing; the phrase tables scan ``text_lower``.
+    """
     statutes: list[str] = []
     seen: set[str] = set()
 
     # 1. Article regex → "Constitution of India, Article XX"
     for match in _ARTICLE_RE.finditer(text):
         articles_str = match.group(1)
-        individual = re.split(r"\s*,\s*|\s+and\s+", articles_str)
+        individual = _LIST_SPLIT_RE.split(articles_str)
         for art in individual:
             art = art.strip()
             # Clean up: remove leading "and " that slips through
             if art.lower().startswith("and "):
                 art = art[4:].strip()
             if art and art[0].isdigit():
-                ref = f"Constitution of India, Article {art}"
+                ref = _ARTICLE_REF_CACHE.get(art)
+                if ref is None:
+                    ref = sys.intern(f"Constitution of India, Article {art}")
+                    _ARTICLE_REF_CACHE[art] = ref
                 if ref not in seen:
                     statutes.append(ref)
                     seen.add(ref)
@@ -470,16 +525,17 @@ def _extract_statutes(text: str) -> list[str]:
             seen.add(act)
 
     # 3. Shorthand statute references
-    text_lower = text.lower()
+    found = _STATUTE_MATCHER.keywords(text_lower)
     for shorthand, full_name in _STATUTE_KEYWORDS.items():
-        if shorthand in text_lower and full_name not in seen:
+        if shorthand in found and full_name not in seen:
             statutes.append(full_name)
             seen.add(full_name)
 
     # 4. Context-based inference — the key improvement!
     # If the text discusses a topic, infer the relevant statutes
+    found = _CONTEXT_MATCHER.keywords(text_lower)
     for context_phrase, inferred_statutes in _CONTEXT_STATUTES.items():
-        if context_phrase in text_lower:
+        if context_phrase in found:
             for statute in inferred_statutes:
                 if statute not in seen:
                     statutes.append(statute)
@@ -488,11 +544,14 @@ def _extract_statutes(text: str) -> list[str]:
     # 5. Standalone section references
     for match in _SECTION_RE.finditer(text):
         sections_str = match.group(1)
-        individual = re.split(r"\s*,\s*|\s+and\s+", sections_str)
+        individual = _LIST_SPLIT_RE.split(sections_str)
         for sec in individual:
             sec = sec.strip()
             if sec:
-                ref = f"Section {sec}"
+                ref = _SECTION_REF_CACHE.get(sec)
+                if ref is None:
+                    ref = sys.intern(f"Section {sec}")
+                    _SECTION_REF_CACHE[sec] = ref
                 if ref not in seen:
                     statutes.append(ref)
                     seen.add(ref)
@@ -4,27 +4,37 @@ Layer 6 — Two-Level Cache.
 Level A: Document Cache (keyed by tid)
     Stores enriched case metadata so we don't re-enrich the same doc.
 
-Level B: Query Cache (keyed by normalized query hash)
+Level B: Query Cache (keyed by normalized query string)
     Stores ranked search results so repeat queries are instant.
 
-Both levels use TTL-based expiration.
+Both levels use TTL-based expiration and are size-bounded LRUs: a hit moves
+the entry to the back, inserts past the limit evict from the front, and every
+CACHE_SWEEP_INTERVAL writes a sweep drops expired entries nobody re-read.
+The search and empower routes call it from worker threads, so every store
+access holds one lock.
 """
 
 from __future__ import annotations
 
-import hashlib
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
-from app.config import CACHE_TTL_SECONDS
+from app.config import (
+    CACHE_MAX_DOC_ENTRIES,
+    CACHE_MAX_QUERY_ENTRIES,
+    CACHE_SWEEP_INTERVAL,
+    CACHE_TTL_SECONDS,
+)
 
 
 # ---------------------------------------------------------------------------
 # Cache Entry
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Single cached value with timestamp."""
     data: Any
@@ -42,60 +52,99 @@ class LegalCache:
     """In-memory cache with document-level and query-level stores."""
 
     def __init__(self):
-        self._doc_cache: dict[str, CacheEntry] = {}     # key = tid
-        self._query_cache: dict[str, CacheEntry] = {}   # key = query hash
+        self._doc_cache: OrderedDict[str, CacheEntry] = OrderedDict()     # key = tid
+        self._query_cache: OrderedDict[str, CacheEntry] = OrderedDict()   # key = normalized query
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
 
     # ---- Document Cache (Level A) ----
 
     def get_doc(self, tid: str | int) -> Any | None:
         """Retrieve cached document metadata by tid."""
-        key = str(tid)
-        entry = self._doc_cache.get(key)
-        if entry is None or entry.is_expired():
-            if entry and entry.is_expired():
-                del self._doc_cache[key]
-            return None
-        return entry.data
+        return self._get(self._doc_cache, str(tid))
 
     def set_doc(self, tid: str | int, data: Any) -> None:
         """Cache document metadata."""
-        self._doc_cache[str(tid)] = CacheEntry(data=data)
+        self._set(self._doc_cache, str(tid), data, CACHE_MAX_DOC_ENTRIES)
 
     # ---- Query Cache (Level B) ----
 
     def get_query(self, query: str) -> Any | None:
         """Retrieve cached query results."""
-        key = self._hash_query(query)
-        entry = self._query_cache.get(key)
-        if entry is None or entry.is_expired():
-            if entry and entry.is_expired():
-                del self._query_cache[key]
-            return None
-        return entry.data
+        return self._get(self._query_cache, self._query_key(query))
 
     def set_query(self, query: str, data: Any) -> None:
         """Cache query results."""
-        self._query_cache[self._hash_query(query)] = CacheEntry(data=data)
+        self._set(self._query_cache, self._query_key(query), data, CACHE_MAX_QUERY_ENTRIES)
 
     # ---- Utilities ----
 
     def clear(self) -> None:
         """Flush both caches."""
-        self._doc_cache.clear()
-        self._query_cache.clear()
+        with self._lock:
+            self._doc_cache.clear()
+            self._query_cache.clear()
 
     @property
     def stats(self) -> dict:
         """Current cache statistics."""
-        return {
-            "doc_entries": len(self._doc_cache),
-            "query_entries": len(self._query_cache),
-        }
+        with self._lock:
+            return {
+                "doc_entries": len(self._doc_cache),
+                "query_entries": len(self._query_cache),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
 
     @staticmethod
-    def _hash_query(query: str) -> str:
-        """Deterministic hash for a normalized query string."""
-        return hashlib.sha256(query.strip().lower().encode()).hexdigest()[:16]
+    def _query_key(query: str) -> str:
+        """Dict key for a query — the normalized string itself.
+
+        Python's built-in str hash already makes this an O(1) lookup; a
+        cryptographic digest per get/set bought nothing for an in-process dict.
+        """
+        return query.strip().lower()
+
+    # ---- LRU internals ----
+
+    def _get(self, store: OrderedDict[str, CacheEntry], key: str) -> Any | None:
+        with self._lock:
+            entry = store.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.is_expired():
+                del store[key]
+                self._misses += 1
+                return None
+            store.move_to_end(key)
+            self._hits += 1
+            return entry.data
+
+    def _set(
+        self,
+        store: OrderedDict[str, CacheEntry],
+        key: str,
+        data: Any,
+        max_entries: int,
+    ) -> None:
+        with self._lock:
+            store[key] = CacheEntry(data=data)
+            store.move_to_end(key)
+            while len(store) > max_entries:
+                store.popitem(last=False)   # least recently used
+
+            self._writes += 1
+            if self._writes % CACHE_SWEEP_INTERVAL == 0:
+                self._sweep()
+
+    def _sweep(self) -> None:
+        """Drop every expired entry from both stores (caller holds the lock)."""
+        for store in (self._doc_cache, self._query_cache):
+            for key in [k for k, e in store.items() if e.is_expired()]:
+                del store[key]
 
 
 # ---------------------------------------------------------------------------
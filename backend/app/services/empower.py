@@ -15,20 +15,30 @@ Pipeline:
 
 from __future__ import annotations
 
+import heapq
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+
 from app.config import (
-    ACTION_ROADMAPS,
-    DEFAULT_ROADMAP,
-    get_authority_tier,
+    ACTION_STEPS_BY_CATEGORY,
+    DEFAULT_ACTION_STEPS,
     PROPERTY_SUBCATEGORIES,
     RELEVANCE_THRESHOLD,
     STATUTE_BLACKLIST_PATTERNS,
     CASE_EXCLUSION_KEYWORDS,
 )
 from app.models.schemas import CaseRecord, CaseResult, EmpowerResponse
-from app.services.ranking import compute_score, tokenize_query
-from app.services.query_normalizer import normalize_query
+from app.services.ranking import matching_case_ids, raw_scores, tokenize_query
+from app.services.query_normalizer import normalize_query, normalize_with_context
 from app.services.kanoon_adapter import get_all_cases
 from app.services.cache import cache
+from app.services.keyword_matcher import KeywordMatcher
+
+# Exclusion / blacklist lists compiled once: one scan per text, not one per keyword
+_EXCLUSION_MATCHER = KeywordMatcher({"exclude": CASE_EXCLUSION_KEYWORDS})
+_STATUTE_BLACKLIST_MATCHER = KeywordMatcher({"blacklist": STATUTE_BLACKLIST_PATTERNS})
+_PROPERTY_MATCHER = KeywordMatcher(PROPERTY_SUBCATEGORIES)
 
 
 # ---------------------------------------------------------------------------
@@ -49,6 +59,7 @@ def _classify_issue(query: str, detected_domain: str) -> str:
     return "General Legal Issue"
 
 
+@lru_cache(maxsize=4096)
 def _refine_property_issue(query: str) -> str:
     """Refine a Property Law classification to a precise sub-category.
 
@@ -56,14 +67,13 @@ def _refine_property_issue(query: str) -> str:
     single-word matches score 1. This ensures 'Security Deposit Recovery'
     beats 'Tenancy Dispute' when the user mentions 'deposit'.
     """
-    q = query.lower()
+    scores = dict.fromkeys(PROPERTY_SUBCATEGORIES, 0)
+    for subcategory, kw in _PROPERTY_MATCHER.hits(query.lower()):
+        scores[subcategory] += 3 if " " in kw else 1
+
     best_match = "Property Law"
     best_score = 0
-    for subcategory, keywords in PROPERTY_SUBCATEGORIES.items():
-        score = 0
-        for kw in keywords:
-            if kw in q:
-                score += 3 if " " in kw else 1
+    for subcategory, score in scores.items():
         if score > best_score:
             best_score = score
             best_match = subcategory
@@ -71,37 +81,17 @@ def _refine_property_issue(query: str) -> str:
 
 
 # ---------------------------------------------------------------------------
-# Case exclusion filter
+# Case exclusion / relevance threshold filters (applied per case while scoring)
 # ---------------------------------------------------------------------------
 
-def _exclude_irrelevant_cases(
-    scored: list[tuple[CaseRecord, float, dict]],
-) -> list[tuple[CaseRecord, float, dict]]:
-    """Remove cases whose summary contains exclusion keywords (terrorism, habeas corpus, etc.)."""
-    filtered = []
-    for case, score, bd in scored:
-        summary_lower = case.summary.lower()
-        case_name_lower = case.case_name.lower()
-        blob = summary_lower + " " + case_name_lower
-        excluded = any(kw in blob for kw in CASE_EXCLUSION_KEYWORDS)
-        if not excluded:
-            filtered.append((case, score, bd))
-    return filtered
+def _is_excluded(case: CaseRecord) -> bool:
+    """True if the case's summary or name contains an exclusion keyword (terrorism, habeas corpus, etc.)."""
+    return _EXCLUSION_MATCHER.contains_any(case.summary_blob)
 
 
-# ---------------------------------------------------------------------------
-# Relevance threshold filter
-# ---------------------------------------------------------------------------
-
-def _apply_relevance_threshold(
-    scored: list[tuple[CaseRecord, float, dict]],
-) -> list[tuple[CaseRecord, float, dict]]:
-    """Discard cases with relevance_score below RELEVANCE_THRESHOLD."""
-    return [
-        (case, score, bd)
-        for case, score, bd in scored
-        if bd.get("relevance_score", 0.0) >= RELEVANCE_THRESHOLD
-    ]
+def _is_relevant(relevance_score: float) -> bool:
+    """True if the case's (rounded) relevance_score clears RELEVANCE_THRESHOLD."""
+    return relevance_score >= RELEVANCE_THRESHOLD
 
 
 # ---------------------------------------------------------------------------
@@ -110,24 +100,19 @@ def _apply_relevance_threshold(
 
 def _collect_relevant_sections(cases: list[CaseRecord]) -> list[str]:
     """De-duplicate statutes from the matched cases, excluding blacklisted patterns."""
-    seen: set[str] = set()
-    sections: list[str] = []
-    for case in cases:
-        for s in case.statutes_referenced:
-            s_lower = s.lower()
-            if any(bl in s_lower for bl in STATUTE_BLACKLIST_PATTERNS):
-                continue
-            if s not in seen:
-                seen.add(s)
-                sections.append(s)
-    return sections
+    return list(dict.fromkeys(
+        s
+        for case in cases
+        for s in case.statutes_referenced
+        if not _STATUTE_BLACKLIST_MATCHER.contains_any(s.lower())
+    ))
 
 
 # ---------------------------------------------------------------------------
 # Legal strength determination
 # ---------------------------------------------------------------------------
 
-def _compute_legal_strength(precedents: list[CaseResult]) -> str:
+def _compute_legal_strength(precedents: list[CaseRecord]) -> str:
     """Heuristic based on quantity and court levels of precedents.
 
     Conservative — only returns 'Strong' if facts clearly support it.
@@ -135,14 +120,8 @@ def _compute_legal_strength(precedents: list[CaseResult]) -> str:
     if not precedents:
         return "Weak"
 
-    supreme_count = sum(
-        1 for p in precedents
-        if get_authority_tier(p.court) == 1
-    )
-    high_count = sum(
-        1 for p in precedents
-        if get_authority_tier(p.court) == 2
-    )
+    tiers = Counter(p.authority_tier for p in precedents)
+    supreme_count, high_count = tiers[1], tiers[2]
     total = len(precedents)
 
     if supreme_count >= 2 or (supreme_count >= 1 and high_count >= 2):
@@ -176,28 +155,31 @@ def analyze_empowerment(query: str, context: str | None = None) -> EmpowerRespon
 
     # Layer 2: Combine query + optional context for relevance matching
     full_query = f"{query} {context}" if context else query
-    full_normalized = normalize_query(full_query) if context else normalized
+    full_normalized = normalize_with_context(normalized, context) if context else normalized
     tokens = full_normalized.expanded_terms or tokenize_query(full_query)
 
-    # Layer 3: Retrieve + dual scoring (empower mode, no authority pre-filter)
+    # Layer 3: Retrieve + dual scoring (empower mode, no authority pre-filter),
+    # dropping filtered-out cases as they are scored:
+    #   Layer 4: Case Exclusion — remove terrorism, habeas corpus, PIL, etc.
+    #   Layer 5: Relevance Threshold — discard low-relevance cases
     all_cases = get_all_cases()
-    scored: list[tuple[CaseRecord, float, dict]] = []
+    matched = matching_case_ids(all_cases, tokens)   # the rest can't pass Layer 5
+    # Raw scores are rounded only for the cases that are kept (authority only
+    # for the top 5); the threshold and the ranking compare rounded values.
+    candidates: list[tuple[CaseRecord, float, float, float]] = []
     for case in all_cases:
-        score, breakdown = compute_score(case, tokens, mode="empower")
-        scored.append((case, score, breakdown))
-
-    scored.sort(key=lambda x: x[1], reverse=True)
-
-    # Layer 4: Case Exclusion — remove terrorism, habeas corpus, PIL, etc.
-    scored = _exclude_irrelevant_cases(scored)
-
-    # Layer 5: Relevance Threshold — discard low-relevance cases
-    scored = _apply_relevance_threshold(scored)
-
-    # Keep top-5 as precedents (may be fewer if filtering removed cases)
+        if case.id not in matched:
+            continue
+        final, authority, relevance = raw_scores(case, tokens)
+        relevance = round(relevance, 2)
+        if _is_relevant(relevance) and not _is_excluded(case):
+            candidates.append((case, round(final, 2), authority, relevance))
+
+    # Keep top-5 as precedents (may be fewer if filtering removed cases).
+    # nlargest is a stable partial sort: same order as a full sort + slice.
     top_precedents: list[CaseResult] = []
     top_records: list[CaseRecord] = []
-    for case, score, bd in scored[:5]:
+    for case, score, authority, relevance in heapq.nlargest(5, candidates, key=itemgetter(1)):
         top_precedents.append(CaseResult(
             kanoon_tid=case.kanoon_tid,
             case_name=case.case_name,
@@ -205,8 +187,8 @@ def analyze_empowerment(query: str, context: str | None = None) -> EmpowerRespon
             year=case.year,
             citation_count=case.citation_count,
             strength_score=score,
-            authority_score=bd.get("authority_score", 0.0),
-            relevance_score=bd.get("relevance_score", 0.0),
+            authority_score=round(authority, 2),
+            relevance_score=relevance,
             summary=case.summary,
         ))
         top_records.append(case)
@@ -215,14 +197,10 @@ def analyze_empowerment(query: str, context: str | None = None) -> EmpowerRespon
     relevant_sections = _collect_relevant_sections(top_records)
 
     # Layer 7: Legal strength
-    legal_strength = _compute_legal_strength(top_precedents)
+    legal_strength = _compute_legal_strength(top_records)
 
     # Layer 8: Action roadmap (deterministic template)
-    roadmap_entries = ACTION_ROADMAPS.get(issue_type, DEFAULT_ROADMAP)
-    action_steps = [
-        f"Step {e['step']}: {e['title']} \u2014 {e['description']}"
-        for e in roadmap_entries
-    ]
+    action_steps = list(ACTION_STEPS_BY_CATEGORY.get(issue_type, DEFAULT_ACTION_STEPS))
 
     response = EmpowerResponse(
         issue_type=issue_type,
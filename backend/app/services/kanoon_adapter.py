@@ -13,15 +13,21 @@ When switching to the real API:
 
 from __future__ import annotations
 
-import json
 import logging
+import sys
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from app.config import KANOON_RAW_FILE, VIDHIMUR_TAGS_FILE
+from app.config import (
+    KANOON_RAW_FILE,
+    VIDHIMUR_TAGS_FILE,
+    get_authority_tier,
+    get_court_weight,
+)
 from app.models.schemas import CaseRecord
+from app.services.ranking import citation_score, recency_boost
 
 logger = logging.getLogger(__name__)
 
@@ -66,13 +72,18 @@ class VidhimurTags(BaseModel):
 # Loaders
 # ---------------------------------------------------------------------------
 
+# Compiled once: validate_json parses the file straight into models in
+# pydantic-core (one pass, no intermediate dicts from json.load).
+_RAW_DOCS_ADAPTER = TypeAdapter(list[KanoonDoc])
+_TAGS_ADAPTER = TypeAdapter(dict[str, VidhimurTags])
+
+
 @lru_cache(maxsize=1)
 def _load_raw_docs() -> list[KanoonDoc]:
     """Load raw Indian Kanoon documents (simulated from local JSON)."""
     if not KANOON_RAW_FILE.exists():
         raise FileNotFoundError(f"Raw Kanoon dataset not found at {KANOON_RAW_FILE}")
-    with open(KANOON_RAW_FILE, encoding="utf-8") as f:
-        return [KanoonDoc(**doc) for doc in json.load(f)]
+    return _RAW_DOCS_ADAPTER.validate_json(KANOON_RAW_FILE.read_bytes())
 
 
 @lru_cache(maxsize=1)
@@ -80,15 +91,18 @@ def _load_tags() -> dict[str, VidhimurTags]:
     """Load enrichment tags keyed by tid (as string)."""
     if not VIDHIMUR_TAGS_FILE.exists():
         return {}  # No tags available — still functional, just less enriched
-    with open(VIDHIMUR_TAGS_FILE, encoding="utf-8") as f:
-        raw = json.load(f)
-    return {tid: VidhimurTags(**data) for tid, data in raw.items()}
+    return _TAGS_ADAPTER.validate_json(VIDHIMUR_TAGS_FILE.read_bytes())
 
 
 # ---------------------------------------------------------------------------
 # Merge Logic (the core adapter)
 # ---------------------------------------------------------------------------
 
+def _intern_all(values: list[str]) -> list[str]:
+    """Intern small-vocabulary tag strings so every case shares one copy."""
+    return [sys.intern(v) for v in values]
+
+
 def _merge(doc: KanoonDoc, tags: VidhimurTags | None) -> CaseRecord:
     """
     Merge raw Kanoon data + enrichment tags into a single CaseRecord.
@@ -100,8 +114,8 @@ def _merge(doc: KanoonDoc, tags: VidhimurTags | None) -> CaseRecord:
 
     # Parse year from publishdate (DD-M-YYYY)
     try:
-        year = int(doc.publishdate.split("-")[-1])
-    except (IndexError, ValueError):
+        year = int(doc.publishdate.rpartition("-")[2])
+    except ValueError:
         year = 0
 
     # Build summary from headline + outcome
@@ -109,23 +123,51 @@ def _merge(doc: KanoonDoc, tags: VidhimurTags | None) -> CaseRecord:
     if tags and tags.outcome:
         summary += f" Outcome: {tags.outcome}"
 
+    # Enrichment (empty if no tags)
+    keywords = _intern_all(tags.keywords) if tags else []
+    legal_issues = _intern_all(tags.legal_issues) if tags else []
+    statutes = _intern_all(tags.statutes_referenced) if tags else []
+
+    # Lowercased text that query relevance is matched against (ranking)
+    search_blob = " ".join([
+        doc.title.lower(),
+        summary.lower(),
+        " ".join(k.lower() for k in keywords),
+        " ".join(i.lower() for i in legal_issues),
+        " ".join(s.lower() for s in statutes),
+    ])
+
+    # Every field comes from already-validated KanoonDoc / VidhimurTags models
     return CaseRecord(
         id=f"KANOON-{doc.tid}",
         kanoon_tid=doc.tid,
         case_name=doc.title,
-        court=doc.docsource,
+        court=sys.intern(doc.docsource),
         year=year,
         citation_count=doc.numcitedby,
         summary=summary,
-        # Enrichment (empty if no tags)
-        keywords=tags.keywords if tags else [],
-        outcome=tags.outcome if tags else "",
-        legal_issues=tags.legal_issues if tags else [],
-        statutes_referenced=tags.statutes_referenced if tags else [],
+        keywords=keywords,
+        outcome=sys.intern(tags.outcome) if tags else "",
+        legal_issues=legal_issues,
+        statutes_referenced=statutes,
         precedents_cited=[c.title for c in doc.citeList],
+        authority_tier=get_authority_tier(doc.docsource),
+        court_weight=get_court_weight(doc.docsource),
+        court_lower=sys.intern(doc.docsource.lower()),
+        citation_score=citation_score(doc.numcitedby),
+        recency_boost=recency_boost(year),
+        summary_blob=f"{summary} {doc.title}".lower(),
+        search_blob=search_blob,
     )
 
 
+@lru_cache(maxsize=1)
+def _load_cases() -> list[CaseRecord]:
+    """Merge raw docs with their tags once; the records are immutable and shared."""
+    tags_map = _load_tags()
+    return [_merge(doc, tags_map.get(str(doc.tid))) for doc in _load_raw_docs()]
+
+
 # ---------------------------------------------------------------------------
 # Failure Strategy — Last successful result fallback
 # ---------------------------------------------------------------------------
@@ -141,6 +183,9 @@ def get_all_cases() -> list[CaseRecord]:
     """
     Load raw Kanoon docs + enrichment tags, merge them, return CaseRecords.
 
+    The merged list is built once per process and shared by every request;
+    callers must treat it as read-only.
+
     Failure Strategy:
         If loading fails, fall back to the last successful result.
         This ensures the system never fully breaks.
@@ -148,14 +193,7 @@ def get_all_cases() -> list[CaseRecord]:
     global _last_good_results
 
     try:
-        raw_docs = _load_raw_docs()
-        tags_map = _load_tags()
-
-        results = [
-            _merge(doc, tags_map.get(str(doc.tid)))
-            for doc in raw_docs
-        ]
-
+        results = _load_cases()
         _last_good_results = results  # Cache for fallback
         return results
 
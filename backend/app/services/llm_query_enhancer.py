@@ -16,9 +16,12 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
 
-from app.config import ISSUE_KEYWORDS
+from app.config import CACHE_TTL_SECONDS, ISSUE_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +39,49 @@ def _get_llm():
             backend_root = Path(__file__).resolve().parent.parent.parent
             if str(backend_root) not in sys.path:
                 sys.path.insert(0, str(backend_root))
-            from services.llm_service import LLMService
-            _llm_service = LLMService()
+            from services.llm_service import get_llm_service
+            _llm_service = get_llm_service()
         except Exception as e:
             logger.warning(f"Could not initialize LLM service: {e}")
     return _llm_service
 
 
-# The valid domains the LLM can classify into
-VALID_DOMAINS = list(ISSUE_KEYWORDS.keys())
+# ---------------------------------------------------------------------------
+# Classification memo — query → (created_at, result)
+# ---------------------------------------------------------------------------
+# Every uncached call is a network round-trip, and citizens ask the same
+# questions over and over. Successful classifications are kept in a bounded
+# LRU for CACHE_TTL_SECONDS; failures (None) are never cached.
+_CACHE_MAX_ENTRIES = 2048
+_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(query: str) -> Optional[dict]:
+    with _cache_lock:
+        hit = _cache.get(query)
+        if hit is None:
+            return None
+        created_at, result = hit
+        if time.time() - created_at > CACHE_TTL_SECONDS:
+            del _cache[query]
+            return None
+        _cache.move_to_end(query)
+    # Callers get their own copy; the cached dict is never handed out
+    return {**result, "search_terms": list(result["search_terms"])}
+
+
+def _cache_put(query: str, result: dict) -> None:
+    with _cache_lock:
+        _cache[query] = (time.time(), {**result, "search_terms": list(result["search_terms"])})
+        _cache.move_to_end(query)
+        if len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+# The valid domains the LLM can classify into (membership checks only; the
+# prompt lists them in ISSUE_KEYWORDS order)
+VALID_DOMAINS: frozenset[str] = frozenset(ISSUE_KEYWORDS)
 
 SYSTEM_PROMPT = """You are a legal domain classifier for Indian law. 
 Given a user's query (which may be in everyday language), you must:
@@ -62,6 +99,9 @@ STRICT RULES:
 - Do NOT hallucinate or invent legal terms
 """
 
+# The domain list is static, so the system prompt is rendered once
+_SYSTEM_PROMPT_FORMATTED = SYSTEM_PROMPT.format(domains=", ".join(ISSUE_KEYWORDS))
+
 USER_PROMPT = """Classify this legal query and extract search terms:
 
 Query: "{query}"
@@ -81,17 +121,22 @@ def llm_classify_query(query: str) -> Optional[dict]:
     Returns:
         dict with keys: domain, search_terms, reasoning
         None if LLM is unavailable or fails
+
+    Successful results are memoized per query string for CACHE_TTL_SECONDS.
     """
+    cached = _cache_get(query)
+    if cached is not None:
+        return cached
+
     llm = _get_llm()
     if llm is None or llm.client is None:
         logger.info("LLM not available, falling back to deterministic classification.")
         return None
 
     try:
-        system = SYSTEM_PROMPT.format(domains=", ".join(VALID_DOMAINS))
         prompt = USER_PROMPT.format(query=query)
 
-        raw = llm.generate_json_response(prompt, system_role=system)
+        raw = llm.generate_json_response(prompt, system_role=_SYSTEM_PROMPT_FORMATTED, memoize=False)
         if not raw:
             return None
 
@@ -107,6 +152,8 @@ def llm_classify_query(query: str) -> Optional[dict]:
 
         logger.info(f"LLM classified '{query}' → {result['domain']} "
                      f"(terms: {result['search_terms']})")
+        llm.memoize(raw, prompt, system_role=_SYSTEM_PROMPT_FORMATTED, json_mode=True)
+        _cache_put(query, result)
         return result
 
     except Exception as e:
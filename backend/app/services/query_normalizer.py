@@ -25,28 +25,50 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
-from app.config import STOPWORDS, LEGAL_SYNONYMS, ISSUE_KEYWORDS
+from app.config import STOPWORDS, LEGAL_SYNONYMS, ISSUE_MATCHER
 
 logger = logging.getLogger(__name__)
 
+_NON_WORD_RE = re.compile(r"\W+")
+# ASCII characters _NON_WORD_RE splits on, mapped to spaces for str.split()
+_ASCII_NON_WORD = str.maketrans(
+    {chr(i): " " for i in range(128) if _NON_WORD_RE.fullmatch(chr(i))}
+)
+
 
 # ---------------------------------------------------------------------------
 # Normalized Query Output
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class NormalizedQuery:
-    """Result of the normalization pipeline."""
+    """Result of the normalization pipeline (immutable — results are shared)."""
     raw_query: str
-    tokens: list[str]                          # Cleaned tokens (stopwords removed)
-    expanded_terms: list[str]                  # Tokens + synonym expansions
+    tokens: tuple[str, ...]                    # Cleaned tokens (stopwords removed)
+    expanded_terms: tuple[str, ...]            # Tokens + synonym expansions
     detected_domain: str                       # Best-match legal area
     search_string: str = ""                    # Final string for IK API
 
     def __post_init__(self):
         if not self.search_string:
-            self.search_string = " ".join(self.expanded_terms)
+            object.__setattr__(self, "search_string", " ".join(self.expanded_terms))
+
+
+# ---------------------------------------------------------------------------
+# Tokenization
+# ---------------------------------------------------------------------------
+
+def split_words(text: str) -> list[str]:
+    """Non-empty pieces of ``text`` split on runs of non-word (``\\W``) characters.
+
+    ASCII text (nearly every query) takes the C-level translate + split path;
+    anything else goes through the regex.
+    """
+    if text.isascii():
+        return text.translate(_ASCII_NON_WORD).split()
+    return [t for t in _NON_WORD_RE.split(text) if t]
 
 
 # ---------------------------------------------------------------------------
@@ -64,22 +86,59 @@ def normalize_query(query: str) -> NormalizedQuery:
     5. Build search string
     """
 
-    # Step 1: Tokenize
-    raw_tokens = re.split(r"\W+", query.lower())
-    raw_tokens = [t for t in raw_tokens if t]   # Remove empty strings
+    # Steps 1-2: Tokenize + remove stopwords
+    return _normalize(query, _clean_tokens(query))
+
+
+def normalize_with_context(normalized: NormalizedQuery, context: str) -> NormalizedQuery:
+    """Normalize ``f"{query} {context}"`` reusing the already-normalized query.
+
+    Only the context is tokenized; the result is identical to running
+    normalize_query on the combined text.
+    """
+    full_query = f"{normalized.raw_query} {context}"
+    return _normalize(full_query, (*normalized.tokens, *_clean_tokens(context)))
+
 
-    # Step 2: Remove stopwords
-    tokens = [t for t in raw_tokens if t not in STOPWORDS and len(t) > 1]
+def _normalize(query: str, tokens: tuple[str, ...]) -> NormalizedQuery:
+    """Run steps 3-5, memoizing whenever the LLM fallback isn't involved."""
+    if _detect_domain(query) == "General Legal Issue":
+        return _build(query, tokens)
+    return _build_cached(query, tokens)
+
+
+# The deterministic steps are pure functions of their (immutable) inputs and
+# are memoized, as are whole results that keyword matching classified; the
+# LLM fallback is not (it keeps its own TTL'd memo), so a transient LLM
+# failure is never pinned into the cache.
+
+@lru_cache(maxsize=4096)
+def _clean_tokens(text: str) -> tuple[str, ...]:
+    """Lowercase, split on non-word characters, drop stopwords and 1-letter tokens."""
+    return tuple(
+        t for t in split_words(text.lower())
+        if t not in STOPWORDS and len(t) > 1
+    )
+
+
+@lru_cache(maxsize=4096)
+def _expand_synonyms(tokens: tuple[str, ...]) -> tuple[str, ...]:
+    """Tokens followed by each new synonym, first occurrence order."""
+    token_set = set(tokens)
+    # dict.fromkeys dedupes while keeping order (a plain set would not, and
+    # the order feeds the search string / cache key)
+    synonyms = dict.fromkeys(
+        syn for t in tokens for syn in LEGAL_SYNONYMS.get(t, ())
+    )
+    return tokens + tuple(syn for syn in synonyms if syn not in token_set)
+
+
+def _build(query: str, tokens: tuple[str, ...]) -> NormalizedQuery:
+    """Steps 3-5 of the pipeline over already-cleaned ``tokens``."""
 
     # Step 3: Expand synonyms
-    expanded = list(tokens)  # Start with cleaned tokens
-    seen = set(tokens)
-    for token in tokens:
-        synonyms = LEGAL_SYNONYMS.get(token, [])
-        for syn in synonyms:
-            if syn not in seen:
-                expanded.append(syn)
-                seen.add(syn)
+    expanded = list(_expand_synonyms(tokens))
+    seen = set(expanded)
 
     # Step 4: Detect legal domain (deterministic first)
     domain = _detect_domain(query)
@@ -104,24 +163,22 @@ def normalize_query(query: str) -> NormalizedQuery:
     return NormalizedQuery(
         raw_query=query,
         tokens=tokens,
-        expanded_terms=expanded,
+        expanded_terms=tuple(expanded),
         detected_domain=domain,
     )
 
 
+_build_cached = lru_cache(maxsize=2048)(_build)
+
+
 # ---------------------------------------------------------------------------
 # Domain Detection (deterministic)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def _detect_domain(query: str) -> str:
     """Match query against ISSUE_KEYWORDS to detect the legal domain."""
-    query_lower = query.lower()
-    scores: dict[str, int] = {}
-
-    for area, keywords in ISSUE_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in query_lower)
-        if score > 0:
-            scores[area] = score
+    scores = ISSUE_MATCHER.counts(query.lower())
 
     if not scores:
         return "General Legal Issue"
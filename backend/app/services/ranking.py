@@ -14,82 +14,109 @@ Mode weights (from config.SCORE_WEIGHTS):
 from __future__ import annotations
 
 import math
-import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import accumulate
 
 from app.config import (
-    get_court_weight,
     CURRENT_YEAR,
     RECENCY_DECAY_RATE,
     RECENCY_MAX_BOOST,
+    RELEVANCE_THRESHOLD,
     SCORE_WEIGHTS,
 )
 from app.models.schemas import CaseRecord
+from app.services.query_normalizer import split_words
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def compute_score(
-    case: CaseRecord,
-    query_tokens: list[str],
-    mode: str = "research",
-) -> tuple[float, dict]:
+def raw_scores(case: CaseRecord, query_tokens: Sequence[str]) -> tuple[float, float, float]:
+    """Unrounded (final_score, authority_score, relevance_score) for a case.
+
+    Callers round to 2 places only the cases they keep.
     """
-    Return (final_score, breakdown_dict) for a case against the query.
+    return _dual_scores(case, _relevance_score(case, query_tokens))
+
+
+def matching_case_ids(cases: list[CaseRecord], query_tokens: Sequence[str]) -> set[str]:
+    """Ids of the cases whose search_blob contains at least one query token.
 
-    Parameters
-    ----------
-    case : CaseRecord
-    query_tokens : list of normalized search tokens
-    mode : "research" or "empower" — determines weighting
+    Any other case has zero keyword overlap, so its relevance_score is just
+    its recency boost (at most RECENCY_MAX_BOOST) and can never clear
+    RELEVANCE_THRESHOLD — callers can skip scoring it. All blobs are scanned
+    as one NUL-joined corpus, jumping to the next case after each hit.
     """
+    if RECENCY_MAX_BOOST >= RELEVANCE_THRESHOLD or "" in query_tokens:
+        return {case.id for case in cases}
+
+    corpus, starts = _corpus_index(cases)
+    n = len(cases)
+    hits: set[int] = set()
+    for token in set(query_tokens):
+        if "\0" in token:
+            continue   # can't occur inside a single blob
+        i = corpus.find(token)
+        while i != -1:
+            k = bisect_right(starts, i) - 1
+            hits.add(k)
+            if k + 1 == n:
+                break
+            i = corpus.find(token, starts[k + 1])
+    return {cases[k].id for k in hits}
 
-    court_w = _court_weight(case.court)
-    citation_s = _citation_score(case.citation_count)
-    recency_b = _recency_boost(case.year)
-    relevance_s = _relevance_score(case, query_tokens)
 
-    # ---- Dual scores ----
-    authority_score = (court_w * 3) + citation_s
-    relevance_score = recency_b + relevance_s
+def tokenize_query(query: str) -> list[str]:
+    """Lowercase split + basic normalisation."""
+    return list(_tokenize(query))
 
-    # ---- Mode-weighted final score ----
-    # Relevance-Gated Authority: Authority only boosts proportionally to relevance.
-    # This prevents irrelevant landmark cases (high authority, 0 relevance)
-    # from dominating results in ANY mode.
-    final_score = relevance_score + (authority_score * (relevance_score / 100.0))
 
-    breakdown = {
-        "authority_score": round(authority_score, 2),
-        "relevance_score": round(relevance_score, 2),
-        "final_score": round(final_score, 2),
-        "mode": mode,
-        # Component detail
-        "court_weight": round(court_w * 3, 2),
-        "citation_score": round(citation_s, 2),
-        "recency_boost": round(recency_b, 2),
-        "query_overlap": round(relevance_s, 2),
-    }
+@lru_cache(maxsize=4096)
+def _tokenize(query: str) -> tuple[str, ...]:
+    return tuple(t for t in split_words(query.lower()) if len(t) > 2)
 
-    return round(final_score, 2), breakdown
 
+# ---------------------------------------------------------------------------
+# Corpus index for matching_case_ids
+# ---------------------------------------------------------------------------
+
+# (cases list it was built from, joined blobs, start offset of each blob).
+# get_all_cases() hands out one shared list, so this is built once.
+_corpus: tuple[list[CaseRecord], str, list[int]] | None = None
 
-def tokenize_query(query: str) -> list[str]:
-    """Lowercase split + basic normalisation."""
-    return [t for t in re.split(r"\W+", query.lower()) if len(t) > 2]
+
+def _corpus_index(cases: list[CaseRecord]) -> tuple[str, list[int]]:
+    global _corpus
+    if _corpus is None or _corpus[0] is not cases:
+        blobs = [case.search_blob for case in cases]
+        starts = list(accumulate((len(b) + 1 for b in blobs[:-1]), initial=0))
+        _corpus = (cases, "\0".join(blobs), starts)
+    return _corpus[1], _corpus[2]
 
 
 # ---------------------------------------------------------------------------
 # Component functions
 # ---------------------------------------------------------------------------
 
-def _court_weight(court: str) -> int:
-    """Map court name → integer weight using pattern matching."""
-    return get_court_weight(court)
+def _dual_scores(case: CaseRecord, relevance_s: float) -> tuple[float, float, float]:
+    """(final_score, authority_score, relevance_score), unrounded."""
+
+    # Query-independent components, precomputed at load (kanoon_adapter)
+    authority_score = (case.court_weight * 3) + case.citation_score
+    relevance_score = case.recency_boost + relevance_s
+
+    # ---- Mode-weighted final score ----
+    # Relevance-Gated Authority: Authority only boosts proportionally to relevance.
+    # This prevents irrelevant landmark cases (high authority, 0 relevance)
+    # from dominating results in ANY mode.
+    final_score = relevance_score + (authority_score * (relevance_score / 100.0))
+    return final_score, authority_score, relevance_score
 
 
-def _citation_score(citation_count: int) -> float:
+def citation_score(citation_count: int) -> float:
     """Citation contribution = log(count + 1).
 
     This drastically reduces the dominance of landmark cases with 100+ citations
@@ -98,7 +125,7 @@ def _citation_score(citation_count: int) -> float:
     return math.log1p(citation_count) * 2
 
 
-def _recency_boost(year: int) -> float:
+def recency_boost(year: int) -> float:
     """Newer cases get up to RECENCY_MAX_BOOST points.
 
     Decays by RECENCY_DECAY_RATE per year of age.
@@ -108,7 +135,7 @@ def _recency_boost(year: int) -> float:
     return max(0.0, round(boost, 2))
 
 
-def _relevance_score(case: CaseRecord, query_tokens: list[str]) -> float:
+def _relevance_score(case: CaseRecord, query_tokens: Sequence[str]) -> float:
     """Keyword overlap score.
 
     Checks keywords, legal_issues, case_name, and summary for matches.
@@ -117,14 +144,8 @@ def _relevance_score(case: CaseRecord, query_tokens: list[str]) -> float:
     if not query_tokens:
         return 0.0
 
-    # Build a searchable text blob from the case
-    case_text = " ".join([
-        case.case_name.lower(),
-        case.summary.lower(),
-        " ".join(k.lower() for k in case.keywords),
-        " ".join(i.lower() for i in case.legal_issues),
-        " ".join(s.lower() for s in case.statutes_referenced),
-    ])
+    # Searchable text blob, lowercased once at load time (kanoon_adapter)
+    case_text = case.search_blob
 
     # Count matches — weighted!
     # Phrases (e.g. "sexual harassment") get 3x weight vs single words
@@ -13,9 +13,11 @@ Pipeline:
 
 from __future__ import annotations
 
-from app.config import get_authority_tier, AUTHORITY_MIN_HIGH_TIER, RELEVANCE_THRESHOLD
+from operator import itemgetter
+
+from app.config import AUTHORITY_MIN_HIGH_TIER, RELEVANCE_THRESHOLD
 from app.models.schemas import CaseRecord, CaseResult, SearchFilters, SearchResponse
-from app.services.ranking import compute_score, tokenize_query
+from app.services.ranking import matching_case_ids, raw_scores, tokenize_query
 from app.services.query_normalizer import normalize_query
 from app.services.kanoon_adapter import get_all_cases
 from app.services.cache import cache
@@ -30,7 +32,7 @@ def _authority_filter(cases: list[CaseRecord]) -> list[CaseRecord]:
     Prioritize higher courts. If enough SC + HC results exist,
     exclude district court cases to reduce noise.
     """
-    higher = [c for c in cases if get_authority_tier(c.court) <= 2]
+    higher = [c for c in cases if c.authority_tier <= 2]
 
     if len(higher) >= AUTHORITY_MIN_HIGH_TIER:
         return higher  # Enough authoritative results; skip lower courts
@@ -46,18 +48,20 @@ def _apply_filters(cases: list[CaseRecord], filters: SearchFilters | None) -> li
     if filters is None:
         return cases
 
-    result = cases
-
-    if filters.court:
-        result = [c for c in result if c.court.lower() == filters.court.lower()]
+    court = filters.court.lower() if filters.court else None
+    year_start = filters.year_start
+    year_end = filters.year_end
 
-    if filters.year_start is not None:
-        result = [c for c in result if c.year >= filters.year_start]
-
-    if filters.year_end is not None:
-        result = [c for c in result if c.year <= filters.year_end]
+    if court is None and year_start is None and year_end is None:
+        return cases
 
-    return result
+    # One pass over the cases with every active filter checked per case
+    return [
+        c for c in cases
+        if (court is None or c.court_lower == court)
+        and (year_start is None or c.year >= year_start)
+        and (year_end is None or c.year <= year_end)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -73,8 +77,11 @@ def search_cases(query: str, filters: SearchFilters | None = None) -> SearchResp
     # Layer 0: Normalize query
     normalized = normalize_query(query)
 
-    # Layer 6: Check query cache first
-    cache_key = normalized.search_string
+    tokens = normalized.expanded_terms or tokenize_query(query)
+
+    # Layer 6: Check query cache first. Scoring only sees the multiset of
+    # tokens, so the key is order-independent: reordered queries share it.
+    cache_key = "|".join(sorted(tokens))
     cached = cache.get_query(cache_key)
     if cached and filters is None:
         return cached
@@ -89,31 +96,43 @@ def search_cases(query: str, filters: SearchFilters | None = None) -> SearchResp
     filtered = _apply_filters(authoritative, filters)
 
     # Layer 4: Dual scoring (mode = "research")
-    tokens = normalized.expanded_terms or tokenize_query(query)
-    scored: list[tuple[CaseRecord, float, dict]] = []
+    # Layer 4c (relevance threshold) is applied as cases are scored, so only
+    # the survivors are sorted. Filtering commutes with the stable sort and
+    # the stable relevance split below, so the order is unchanged.
+    matched = matching_case_ids(cases, tokens)   # the rest can't pass Layer 4c
+    # Raw scores are rounded only for the cases that are kept; the threshold
+    # and the sort compare the rounded values, as the response reports them.
+    scored: list[tuple[CaseRecord, float, float, float]] = []
     for case in filtered:
-        score, breakdown = compute_score(case, tokens, mode="research")
-        scored.append((case, score, breakdown))
+        if case.id not in matched:
+            continue
+        final, authority, relevance = raw_scores(case, tokens)
+        relevance = round(relevance, 2)
+        if relevance >= RELEVANCE_THRESHOLD:
+            scored.append((case, round(final, 2), authority, relevance))
 
-    scored.sort(key=lambda x: x[1], reverse=True)
+    scored.sort(key=itemgetter(1), reverse=True)
 
     # Layer 4b: Relevance-aware reranking
     # Separate cases with meaningful relevance from authority-only cases.
     # This prevents irrelevant landmark cases (high authority, 0 relevance)
     # from pushing genuinely relevant cases out of the top results.
+    # Every case that passed Layer 4c already clears the minimum whenever
+    # RELEVANCE_THRESHOLD >= RESEARCH_RELEVANCE_MIN, so the split only runs
+    # when it can actually move something. It is one stable pass.
     RESEARCH_RELEVANCE_MIN = 5.0
-    relevant = [(c, s, b) for c, s, b in scored if b.get("relevance_score", 0) >= RESEARCH_RELEVANCE_MIN]
-    authority_only = [(c, s, b) for c, s, b in scored if b.get("relevance_score", 0) < RESEARCH_RELEVANCE_MIN]
-
-    # Show relevant cases first, then backfill with authority-only cases
-    scored = relevant + authority_only
+    if RELEVANCE_THRESHOLD < RESEARCH_RELEVANCE_MIN:
+        relevant: list[tuple[CaseRecord, float, float, float]] = []
+        authority_only: list[tuple[CaseRecord, float, float, float]] = []
+        for entry in scored:
+            (relevant if entry[3] >= RESEARCH_RELEVANCE_MIN else authority_only).append(entry)
 
-    # Layer 4c: Relevance threshold — hide cases with near-zero relevance
-    scored = [(c, s, b) for c, s, b in scored if b.get("relevance_score", 0) >= RELEVANCE_THRESHOLD]
+        # Show relevant cases first, then backfill with authority-only cases
+        scored = relevant + authority_only
 
     # Layer 7: Build structured output
     top_cases: list[CaseResult] = []
-    for case, score, bd in scored:
+    for case, score, authority, relevance in scored:
         top_cases.append(CaseResult(
             kanoon_tid=case.kanoon_tid,
             case_name=case.case_name,
@@ -121,8 +140,8 @@ def search_cases(query: str, filters: SearchFilters | None = None) -> SearchResp
             year=case.year,
             citation_count=case.citation_count,
             strength_score=score,
-            authority_score=bd.get("authority_score", 0.0),
-            relevance_score=bd.get("relevance_score", 0.0),
+            authority_score=round(authority, 2),
+            relevance_score=relevance,
             summary=case.summary,
         ))
 
@@ -7,20 +7,22 @@ from English to the requested language. Returns original text for English.
 from __future__ import annotations
 
 import os
-import json
 import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-# Load .ENV file from backend root
+from dotenv import load_dotenv
+
+# Load .ENV file from backend root. Every key in it is applied, but never over
+# a value the environment (container, shell) already provides
 _env_path = Path(__file__).resolve().parent.parent.parent / ".ENV"
 if _env_path.exists():
-    with open(_env_path) as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, _, value = line.partition("=")
-                os.environ.setdefault(key.strip(), value.strip())
+    load_dotenv(dotenv_path=_env_path, override=False)
 
 logger = logging.getLogger(__name__)
 
@@ -42,18 +44,106 @@ LANG_NAMES: dict[str, str] = {
 }
 
 
-def _get_groq_client() -> Any:
-    """Lazily create a Groq client."""
-    try:
-        from groq import Groq
-        api_key = os.getenv("GROQ_API_KEY", "")
-        if not api_key or api_key.startswith("gsk_74j2y4"):
-            logger.warning("GROQ_API_KEY not set or is placeholder — translation disabled")
-            return None
-        return Groq(api_key=api_key)
-    except ImportError:
-        logger.warning("groq package not installed — translation disabled")
-        return None
+# ---------------------------------------------------------------------------
+# System prompts — one string per language, built on first use
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=64)
+def _single_system_prompt(lang: str) -> str:
+    return (
+        f"You are a translator. Translate the following text to {LANG_NAMES.get(lang, lang)}. "
+        "Return ONLY the translated text, nothing else. "
+        "Translate everything including legal case names, court names, and statute references. "
+        "Do not add any explanation."
+    )
+
+
+@lru_cache(maxsize=64)
+def _batch_system_prompt(lang: str) -> str:
+    return (
+        f"You are a translator. Translate each numbered item below to {LANG_NAMES.get(lang, lang)}. "
+        "Return ONLY the translated numbered list in the same format (e.g. '1. translated text'). "
+        "Translate everything including legal case names, court names, and statute references. "
+        "Do not add any explanation."
+    )
+
+
+# ---------------------------------------------------------------------------
+# Translation memo — (lang, source text) → translated text
+# ---------------------------------------------------------------------------
+# Court names, statutes and roadmap steps repeat across almost every response,
+# so successful translations are kept in a bounded LRU. Fallbacks (original
+# text returned on failure) are never cached.
+_CACHE_MAX_ENTRIES = 100_000
+_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+_cache_lock = threading.Lock()   # translate_* run on threadpool workers
+
+
+def _cache_get(text: str, lang: str) -> str | None:
+    key = (lang, text)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+        return hit
+
+
+def _cache_put(text: str, lang: str, translated: str) -> None:
+    key = (lang, text)
+    with _cache_lock:
+        _cache[key] = translated
+        _cache.move_to_end(key)
+        if len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+_llm: Any = None
+_llm_resolved = False
+_llm_lock = threading.Lock()
+
+
+def _get_llm() -> Any:
+    """The shared LLMService from backend/services (None if unavailable).
+
+    Translations are the busiest Groq traffic, so they go through the same
+    client, rate limiter, circuit breaker and timeout as every other caller.
+    Resolved once under a lock: concurrent first calls share one instance
+    and the "disabled" warning is logged once.
+    """
+    global _llm, _llm_resolved
+    with _llm_lock:
+        if not _llm_resolved:
+            _llm_resolved = True
+            api_key = os.getenv("GROQ_API_KEY", "")
+            if not api_key or api_key.startswith("gsk_74j2y4"):
+                logger.warning("GROQ_API_KEY not set or is placeholder — translation disabled")
+            else:
+                try:
+                    import sys
+                    backend_root = Path(__file__).resolve().parent.parent.parent
+                    if str(backend_root) not in sys.path:
+                        sys.path.insert(0, str(backend_root))
+                    from services.llm_service import get_llm_service
+                    _llm = get_llm_service()
+                except ImportError:
+                    logger.warning("groq package not installed — translation disabled")
+        return _llm
+
+
+# ---------------------------------------------------------------------------
+# Batch sharding — large batches go out as concurrent chunked round-trips
+# ---------------------------------------------------------------------------
+# One long generation is the slowest way to translate dozens of strings, and a
+# single malformed reply would throw all of them away. Misses are split into
+# chunks that run in parallel (network-bound, so threads are enough); a failed
+# chunk only falls back for its own texts.
+_BATCH_CHUNK_SIZE = 10
+_MAX_CONCURRENCY = int(os.getenv("TRANSLATE_MAX_CONCURRENCY", "8"))
+
+
+@lru_cache(maxsize=1)
+def _get_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=_MAX_CONCURRENCY, thread_name_prefix="translate")
 
 
 def translate_text(text: str, lang: str) -> str:
@@ -61,90 +151,94 @@ def translate_text(text: str, lang: str) -> str:
     if lang == "en" or not text or not text.strip():
         return text
 
-    lang_name = LANG_NAMES.get(lang, lang)
-    client = _get_groq_client()
-    if client is None:
-        return text  # Fallback: return original
+    cached = _cache_get(text, lang)
+    if cached is not None:
+        return cached
 
-    try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        f"You are a translator. Translate the following text to {lang_name}. "
-                        "Return ONLY the translated text, nothing else. "
-                        "Translate everything including legal case names, court names, and statute references. "
-                        "Do not add any explanation."
-                    ),
-                },
-                {"role": "user", "content": text},
-            ],
-            temperature=0.1,
-            max_tokens=1024,
-        )
-        translated = response.choices[0].message.content
-        return translated.strip() if translated else text
-    except Exception as exc:
-        logger.error("Translation failed: %s", exc)
+    llm = _get_llm()
+    if llm is None:
         return text  # Fallback: return original
 
+    # The translation memo above is the cache; the LLM memo is bypassed
+    translated = llm.generate_response(
+        text,
+        system_role=_single_system_prompt(lang),
+        temperature=0.1,
+        use_memo=False,
+        max_tokens=1024,
+    )
+    if not translated:
+        return text  # Fallback: return original (the LLM service logged why)
+    _cache_put(text, lang, translated)
+    return translated
+
 
 def translate_batch(texts: list[str], lang: str) -> list[str]:
-    """Translate multiple texts in a single LLM call for efficiency."""
+    """Translate multiple texts in as few LLM calls as possible.
+
+    Texts already in the translation memo are served from it; only the
+    distinct misses are sent to the LLM, in concurrent chunks of
+    _BATCH_CHUNK_SIZE.
+    """
     if lang == "en" or not texts:
         return texts
 
-    lang_name = LANG_NAMES.get(lang, lang)
-    client = _get_groq_client()
-    if client is None:
-        return texts
+    result = [_cache_get(t, lang) for t in texts]
+    # Court names and statutes repeat within a page — translate each once
+    misses = list(dict.fromkeys(t for t, hit in zip(texts, result) if hit is None))
+    if not misses:
+        return result  # type: ignore[return-value]
+
+    chunks = [misses[i:i + _BATCH_CHUNK_SIZE] for i in range(0, len(misses), _BATCH_CHUNK_SIZE)]
+    if len(chunks) == 1:
+        outputs = [_translate_batch_uncached(misses, lang)]
+    else:
+        outputs = list(_get_pool().map(lambda chunk: _translate_batch_uncached(chunk, lang), chunks))
+
+    translated: dict[str, str] = {}
+    for chunk, output in zip(chunks, outputs):
+        translated.update(zip(chunk, chunk if output is None else output))  # Fallback: originals, not cached
+
+    return [hit if hit is not None else translated[t] for t, hit in zip(texts, result)]
+
+
+# "1. ", "1) " or "1: " numbering the model puts in front of each item
+_NUMBER_PREFIX_RE = re.compile(r"\d+(?:\. |\) |: )")
+
+
+def _translate_batch_uncached(texts: list[str], lang: str) -> list[str] | None:
+    """One LLM round-trip for ``texts``; None if translation is unavailable."""
+    llm = _get_llm()
+    if llm is None:
+        return None
 
     # Pack texts as numbered list for batch translation
     numbered = "\n".join(f"{i+1}. {t}" for i, t in enumerate(texts))
 
-    try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        f"You are a translator. Translate each numbered item below to {lang_name}. "
-                        "Return ONLY the translated numbered list in the same format (e.g. '1. translated text'). "
-                        "Translate everything including legal case names, court names, and statute references. "
-                        "Do not add any explanation."
-                    ),
-                },
-                {"role": "user", "content": numbered},
-            ],
-            temperature=0.1,
-            max_tokens=4096,
-        )
-
-        raw = response.choices[0].message.content or ""
-        lines = raw.strip().split("\n")
-
-        result: list[str] = []
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            # Remove numbering prefix like "1. " or "1) "
-            for sep in [". ", ") ", ": "]:
-                idx = line.find(sep)
-                if idx != -1 and line[:idx].isdigit():
-                    line = line[idx + len(sep):]
-                    break
-            result.append(line)
-
-        # If parsing failed, return originals
-        if len(result) != len(texts):
-            logger.warning("Batch translation count mismatch: expected %d, got %d", len(texts), len(result))
-            return texts
-
-        return result
-    except Exception as exc:
-        logger.error("Batch translation failed: %s", exc)
-        return texts
+    raw = llm.generate_response(
+        numbered,
+        system_role=_batch_system_prompt(lang),
+        temperature=0.1,
+        use_memo=False,
+        max_tokens=4096,
+    )
+    if not raw:
+        return None  # The LLM service logged why; the caller falls back
+
+    result: list[str] = []
+    for line in raw.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        # Remove numbering prefix like "1. " or "1) "
+        prefix = _NUMBER_PREFIX_RE.match(line)
+        result.append(line[prefix.end():] if prefix else line)
+
+    # If parsing failed, the caller falls back to the originals
+    if len(result) != len(texts):
+        logger.warning("Batch translation count mismatch: expected %d, got %d", len(texts), len(result))
+        return None
+
+    for source, translated in zip(texts, result):
+        _cache_put(source, lang, translated)
+    return result
@@ -9,10 +9,13 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import orjson
+
 # Add parent to path so we can import app modules
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
@@ -22,39 +25,55 @@ from app.services.auto_tagger import generate_tags
 
 def load_raw_cases() -> list[dict]:
     """Load cases from kanoon_raw.json."""
-    with open(KANOON_RAW_FILE, encoding="utf-8") as f:
-        return json.load(f)
+    with open(KANOON_RAW_FILE, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def load_existing_tags() -> dict:
     """Load existing vidhimur_tags.json if it exists."""
     if VIDHIMUR_TAGS_FILE.exists():
-        with open(VIDHIMUR_TAGS_FILE, encoding="utf-8") as f:
-            return json.load(f)
+        with open(VIDHIMUR_TAGS_FILE, "rb") as f:
+            return orjson.loads(f.read())
     return {}
 
 
+# Below this many cases, worker start-up costs more than tagging sequentially
+PARALLEL_MIN_CASES = 256
+
+
+def _tag_one(case: dict) -> tuple[str, dict]:
+    """Tag a single raw case (module-level so worker processes can run it)."""
+    cite_titles = [c.get("title", "") for c in case.get("citeList", [])]
+
+    tags = generate_tags(
+        title=case["title"],
+        headline=case["headline"],
+        docsource=case["docsource"],
+        cite_titles=cite_titles,
+    )
+    return str(case["tid"]), tags.to_dict()
+
+
 def generate_all_tags(cases: list[dict]) -> dict:
-    """Generate tags for all cases."""
-    all_tags = {}
-    for case in cases:
-        tid = str(case["tid"])
-        cite_titles = [c.get("title", "") for c in case.get("citeList", [])]
+    """Generate tags for all cases.
+
+    Tagging is CPU-bound and independent per case, so large corpora are
+    spread over a process pool; results keep the input order either way.
+    """
+    if len(cases) < PARALLEL_MIN_CASES:
+        return dict(map(_tag_one, cases))
+
+    with ProcessPoolExecutor() as executor:
+        return dict(executor.map(_tag_one, cases, chunksize=16))
 
-        tags = generate_tags(
-            title=case["title"],
-            headline=case["headline"],
-            docsource=case["docsource"],
-            cite_titles=cite_titles,
-        )
-        all_tags[tid] = tags.to_dict()
 
-    return all_tags
+def build_case_lookup(cases: list[dict]) -> dict[str, dict]:
+    """Index raw cases by tid (as a string, matching the tags' keys)."""
+    return {str(c["tid"]): c for c in cases}
 
 
-def print_tags(all_tags: dict, cases: list[dict]) -> None:
+def print_tags(all_tags: dict, case_lookup: dict[str, dict]) -> None:
     """Pretty-print auto-generated tags."""
-    case_lookup = {str(c["tid"]): c for c in cases}
 
     for tid, tags in all_tags.items():
         case = case_lookup.get(tid, {})
@@ -68,9 +87,8 @@ def print_tags(all_tags: dict, cases: list[dict]) -> None:
         print(f"  Statutes:   {tags['statutes_referenced']}")
 
 
-def compare_tags(auto_tags: dict, hand_tags: dict, cases: list[dict]) -> None:
+def compare_tags(auto_tags: dict, hand_tags: dict, case_lookup: dict[str, dict]) -> None:
     """Compare auto-generated tags with hand-written ones."""
-    case_lookup = {str(c["tid"]): c for c in cases}
 
     for tid in auto_tags:
         case = case_lookup.get(tid, {})
@@ -119,22 +137,28 @@ def compare_tags(auto_tags: dict, hand_tags: dict, cases: list[dict]) -> None:
 
 
 def write_tags(all_tags: dict) -> None:
-    """Write tags to vidhimur_tags.json."""
-    with open(VIDHIMUR_TAGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_tags, f, indent=4, ensure_ascii=False)
+    """Write tags to vidhimur_tags.json.
+
+    Written to a temp file and swapped in, so an interrupted run never
+    leaves a truncated tags file behind.
+    """
+    tmp = VIDHIMUR_TAGS_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(all_tags, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, VIDHIMUR_TAGS_FILE)
     print(f"\n✅ Written {len(all_tags)} entries to {VIDHIMUR_TAGS_FILE}")
 
 
 if __name__ == "__main__":
     cases = load_raw_cases()
     auto_tags = generate_all_tags(cases)
+    case_lookup = build_case_lookup(cases)
 
     if "--compare" in sys.argv:
         hand_tags = load_existing_tags()
-        compare_tags(auto_tags, hand_tags, cases)
+        compare_tags(auto_tags, hand_tags, case_lookup)
     elif "--write" in sys.argv:
-        print_tags(auto_tags, cases)
+        print_tags(auto_tags, case_lookup)
         write_tags(auto_tags)
     else:
-        print_tags(auto_tags, cases)
+        print_tags(auto_tags, case_lookup)
         print(f"\n💡 Run with --write to save, or --compare to diff against hand-written tags.")
@@ -0,0 +1,16 @@
+import logging
+
+_configured = False
+
+
+def configure_once() -> None:
+    """Set up root logging for the services package, the first time only.
+
+    Every service module calls this at import; after the first call it is a
+    flag check instead of another logging.basicConfig pass.
+    """
+    global _configured
+    if _configured:
+        return
+    logging.basicConfig(level=logging.INFO)
+    _configured = True
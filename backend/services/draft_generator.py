@@ -1,7 +1,7 @@
-import json
+import orjson
 import logging
 from typing import Dict, Any
-from .llm_service import LLMService
+from .llm_service import get_llm_service
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -13,7 +13,7 @@ class DraftGenerator:
     """
 
     def __init__(self):
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
 
     def generate_draft(self, case_data: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -51,13 +51,14 @@ class DraftGenerator:
 
         try:
             response_json_str = self.llm_service.generate_json_response(
-                prompt=prompt, 
-                system_role=system_role
+                prompt=prompt,
+                system_role=system_role,
+                memoize=False
             )
 
             if response_json_str:
                 try:
-                    response_data = json.loads(response_json_str)
+                    response_data = orjson.loads(response_json_str)
                     
                     # Validation: Check strictly for required keys
                     required_output_keys = ["complaint_title", "draft_text", "recommended_authority"]
@@ -75,9 +76,10 @@ class DraftGenerator:
                         logger.warning("Draft text exceeded 5000 characters.")
                         return self._get_fallback_response("Draft too long.")
 
+                    self.llm_service.memoize(response_json_str, prompt, system_role, json_mode=True)
                     return response_data
 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error("Failed to decode JSON from LLM response.")
                     return self._get_fallback_response("Output format error.")
 
@@ -92,9 +94,9 @@ class DraftGenerator:
         """Constructs a strict, hallucination-resistant prompt."""
         
         # Serialize fields to JSON strings to avoid raw Python list injection
-        relevant_sections_str = json.dumps(data.get('relevant_sections', []), indent=2)
-        precedents_str = json.dumps(data.get('precedents', []), indent=2)
-        action_steps_str = json.dumps(data.get('action_steps', []), indent=2)
+        relevant_sections_str = orjson.dumps(data.get('relevant_sections', []), option=orjson.OPT_INDENT_2).decode()
+        precedents_str = orjson.dumps(data.get('precedents', []), option=orjson.OPT_INDENT_2).decode()
+        action_steps_str = orjson.dumps(data.get('action_steps', []), option=orjson.OPT_INDENT_2).decode()
 
         return f"""
 You are a legal drafting assistant working inside a precedent-aware legal intelligence system.
@@ -107,9 +109,6 @@ STRICT RULES:
 - Do NOT modify the legal_strength value.
 - Do NOT fabricate facts.
 - If precedents list is empty, still generate a draft using issue_type and relevant_sections only.
-- Output MUST be valid JSON.
-- Do NOT include explanations outside JSON.
-- Do NOT include markdown formatting.
 - Return ONLY a JSON object.
 
 INPUT DATA:
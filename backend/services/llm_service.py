@@ -1,11 +1,22 @@
 import os
-import json
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Optional
-from groq import Groq
+from typing import Iterator, Optional
+import httpx
+import orjson
+from groq import (
+    APIConnectionError,
+    DefaultHttpxClient,
+    Groq,
+    InternalServerError,
+    RateLimitError,
+)
 from dotenv import load_dotenv
+from ._logging import configure_once
 
 # Load .env file from the backend directory (parent of services)
 backend_env_path = Path(__file__).resolve().parent.parent / '.env'
@@ -15,9 +26,231 @@ load_dotenv(dotenv_path=backend_env_path)
 root_env_path = Path(__file__).resolve().parent.parent.parent / '.env'
 load_dotenv(dotenv_path=root_env_path)
 
-logging.basicConfig(level=logging.INFO)
+configure_once()
 logger = logging.getLogger(__name__)
 
+# Outermost {...} span of a reply (first "{" to last "}")
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+class RateLimiter:
+    """
+    Rolling 60-second requests-per-minute / tokens-per-minute limiter.
+
+    acquire() blocks until the call fits both budgets, so bursts are spread
+    out at the provider's limit instead of failing with 429s. A limit of 0
+    disables that budget. It waits with time.sleep, so it must only run on a
+    worker thread — every API route reaches LLMService via asyncio.to_thread.
+    """
+
+    WINDOW = 60.0
+
+    def __init__(self, rpm_limit: int = 0, tpm_limit: int = 0):
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self._calls: deque = deque()   # (timestamp, estimated tokens)
+        self._tokens = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rpm_limit > 0 or self.tpm_limit > 0
+
+    def acquire(self, estimated_tokens: int) -> None:
+        if not self.enabled:
+            return
+        # A single call larger than the whole TPM budget could never fit
+        if self.tpm_limit:
+            estimated_tokens = min(estimated_tokens, self.tpm_limit)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0][0] >= self.WINDOW:
+                    self._tokens -= self._calls.popleft()[1]
+
+                rpm_ok = not self.rpm_limit or len(self._calls) < self.rpm_limit
+                tpm_ok = not self.tpm_limit or self._tokens + estimated_tokens <= self.tpm_limit
+                if rpm_ok and tpm_ok:
+                    self._calls.append((now, estimated_tokens))
+                    self._tokens += estimated_tokens
+                    return
+
+                # Both budgets free up when the oldest call leaves the window
+                wait = self._calls[0][0] + self.WINDOW - now
+
+            logger.info(f"LLM rate limit reached, waiting {wait:.1f}s")
+            time.sleep(wait)
+
+
+# One limiter per process: the provider's limits apply to the API key, not to
+# individual service instances
+_rate_limiter = RateLimiter(
+    rpm_limit=int(os.getenv("LLM_RPM_LIMIT", "0")),
+    tpm_limit=int(os.getenv("LLM_TPM_LIMIT", "0")),
+)
+
+
+class CircuitBreaker:
+    """
+    Fails LLM calls fast while the provider keeps failing.
+
+    After ``fail_max`` consecutive failed calls (each already retried by the
+    SDK) the breaker opens: calls are refused without touching the network,
+    so the services return their error replies immediately instead of each
+    waiting out its own timeouts. After ``reset_timeout`` seconds one trial
+    call is let through; success closes the breaker, failure re-opens it.
+    A fail_max of 0 disables it.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if not self.fail_max:
+            return True
+        with self._lock:
+            if self._refusing():
+                return False
+            if self._opened_at is not None:
+                self._trial_running = True
+            return True
+
+    def is_open(self) -> bool:
+        """True while calls would be refused. Unlike allow(), it never claims
+        the trial call, so callers can check ahead of time."""
+        if not self.fail_max:
+            return False
+        with self._lock:
+            return self._refusing()
+
+    def _refusing(self) -> bool:
+        return self._opened_at is not None and (
+            self._trial_running or time.monotonic() - self._opened_at < self.reset_timeout
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self.fail_max and self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning(f"LLM circuit breaker opened after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+
+
+# Errors that say the provider itself is unhealthy: timeouts (APITimeoutError
+# is an APIConnectionError), connection failures, 429s and 5xx replies. Other
+# errors (400s such as an oversized prompt, a bug in reply handling) come from
+# a single request, and one user's bad requests must not open the breaker for
+# everyone.
+_BREAKER_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+# Shared for the same reason as the rate limiter: an outage hits every service
+_circuit_breaker = CircuitBreaker(
+    fail_max=int(os.getenv("LLM_BREAKER_FAIL_MAX", "5")),
+    reset_timeout=float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30")),
+)
+
+# Hard per-request read timeout. Retries on timeouts, 429s and 5xx replies
+# (exponential backoff with jitter) are left to the Groq SDK.
+_REQUEST_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+_MAX_RETRIES = 2
+
+
+# ---------------------------------------------------------------------------
+# Response memo — (model, system_role, prompt, temperature, json_mode, max_tokens) → text
+# ---------------------------------------------------------------------------
+# Simplifier, translator, roadmap and enhancer prompts repeat for repeat
+# inputs; an exact hit skips both the rate limiter and the network round-trip.
+# Bounded LRU with a TTL (LLM_CACHE_TTL_SECONDS, 0 disables); failures, empty
+# replies and replies that fail validation (invalid JSON, or a caller's own
+# checks — see LLMService.memoize) are never cached. Hits / misses are counted (cache_stats()).
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
+
+
+def cache_stats() -> dict:
+    """Current response-memo statistics."""
+    with _cache_lock:
+        return {"entries": len(_cache), "hits": _cache_hits, "misses": _cache_misses}
+
+
+def _cache_get(key: tuple) -> Optional[str]:
+    global _cache_hits, _cache_misses
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] > _CACHE_TTL_SECONDS:
+            del _cache[key]
+            hit = None
+        if hit is None:
+            _cache_misses += 1
+            return None
+        _cache.move_to_end(key)
+        _cache_hits += 1
+        return hit[1]
+
+
+def _cache_put(key: tuple, content: str) -> None:
+    if _CACHE_TTL_SECONDS <= 0:
+        return
+    with _cache_lock:
+        _cache[key] = (time.monotonic(), content)
+        _cache.move_to_end(key)
+        if len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+# HTTP/2 multiplexes concurrent calls (e.g. roadmap + enhance for one page)
+# over a single connection. httpx needs the optional h2 package for it
+# (pip install "httpx[http2]"); without it the pool stays on HTTP/1.1 keep-alive.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+
+# Guards client / service construction: lru_cache doesn't serialize
+# concurrent first calls, and every duplicate would take a pool with it
+_client_lock = threading.RLock()
+_clients: dict = {}
+
+
+def _shared_client(api_key: str) -> Groq:
+    """One Groq client per API key, shared by every LLMService instance so
+    the underlying HTTP connection pool is reused across calls."""
+    with _client_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = _build_client(api_key)
+        return client
+
+
+def _build_client(api_key: str) -> Groq:
+    http_client = DefaultHttpxClient(
+        http2=_HTTP2,
+        timeout=httpx.Timeout(_REQUEST_TIMEOUT_SECONDS, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+    return Groq(api_key=api_key, http_client=http_client, max_retries=_MAX_RETRIES)
+
+
 class LLMService:
     """
     Groq LLM Service using hosted open-source models.
@@ -31,28 +264,62 @@ class LLMService:
         if not self.api_key:
             logger.warning("GROQ_API_KEY not set.")
         else:
-            self.client = Groq(api_key=self.api_key)
+            self.client = _shared_client(self.api_key)
+
+    def is_available(self) -> bool:
+        """True if a call would reach Groq: the client is set up and the
+        circuit breaker isn't refusing calls."""
+        return self.client is not None and not _circuit_breaker.is_open()
 
     def generate_response(
         self,
         prompt: str,
         system_role: str = "You are a helpful assistant.",
-        temperature: float = 0.2
+        temperature: float = 0.2,
+        json_mode: bool = False,
+        model: Optional[str] = None,
+        use_memo: bool = True,
+        max_tokens: Optional[int] = None
     ) -> Optional[str]:
+        """Plain completion text; ``json_mode`` asks Groq to emit a JSON object.
+
+        ``model`` overrides the instance's model for this one call, and
+        ``max_tokens`` caps the reply length.
+        ``use_memo=False`` bypasses the response memo, for callers that
+        validate the reply first and memoize it themselves.
+        """
 
         if not self.client:
             logger.warning("Groq client not initialized.")
             return None
 
+        model = model or self.model_name
+        cache_key = self._memo_key(prompt, system_role, temperature, json_mode, model, max_tokens)
+        if use_memo:
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        if not _circuit_breaker.allow():
+            logger.warning("LLM circuit breaker open; skipping Groq call.")
+            return None
+
+        # ~4 characters per token is close enough for budgeting
+        _rate_limiter.acquire((len(system_role) + len(prompt)) // 4)
+
         try:
             completion = self.client.chat.completions.create(
-                model=self.model_name,
+                model=model,
                 messages=[
                     {"role": "system", "content": system_role},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=temperature
+                temperature=temperature,
+                # Provider-side JSON mode: the reply is a bare JSON object
+                **({"response_format": {"type": "json_object"}} if json_mode else {}),
+                **({"max_tokens": max_tokens} if max_tokens else {})
             )
+            _circuit_breaker.record_success()
 
             choice = completion.choices[0]
             logger.info(f"Groq finish_reason: {choice.finish_reason}")
@@ -62,62 +329,233 @@ class LLMService:
                 return ""
             
             logger.debug(f"Groq raw content: {content}")
-            return content.strip()
+            content = content.strip()
+            if use_memo:
+                _cache_put(cache_key, content)
+            return content
+
+        except _BREAKER_ERRORS as e:
+            logger.error(f"Groq API Error: {str(e)}")
+            _circuit_breaker.record_failure()
+            return None
 
         except Exception as e:
             logger.error(f"Groq API Error: {str(e)}")
+            # The provider answered, so it counts as healthy (this also frees
+            # a half-open trial slot)
+            _circuit_breaker.record_success()
             return None
 
-    def generate_json_response(
+    def generate_response_stream(
         self,
         prompt: str,
         system_role: str = "You are a helpful assistant.",
         temperature: float = 0.2
+    ) -> Iterator[str]:
+        """Plain completion text, yielded in pieces as Groq produces them.
+
+        Shares the response memo with generate_response: a memoized reply is
+        yielded whole, and a fully streamed reply is memoized. Yields nothing
+        if no call can be made (no client, breaker open); a provider error is
+        logged and re-raised, so the caller can tell a cut-off reply from a
+        complete one.
+        """
+
+        if not self.client:
+            logger.warning("Groq client not initialized.")
+            return
+
+        cache_key = self._memo_key(prompt, system_role, temperature, False, self.model_name)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        if not _circuit_breaker.allow():
+            logger.warning("LLM circuit breaker open; skipping Groq call.")
+            return
+
+        _rate_limiter.acquire((len(system_role) + len(prompt)) // 4)
+
+        parts: list[str] = []
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": system_role},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                stream=True
+            )
+            # Counted once the stream is open: the caller may stop reading
+            # early, and the breaker must not wait on that
+            _circuit_breaker.record_success()
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    # Leading whitespace is dropped, as generate_response strips it
+                    if not parts:
+                        delta = delta.lstrip()
+                        if not delta:
+                            continue
+                    parts.append(delta)
+                    yield delta
+
+        except _BREAKER_ERRORS as e:
+            logger.error(f"Groq API Error: {str(e)}")
+            _circuit_breaker.record_failure()
+            raise
+
+        except Exception as e:
+            logger.error(f"Groq API Error: {str(e)}")
+            _circuit_breaker.record_success()
+            raise
+
+        content = "".join(parts).strip()
+        if content:
+            _cache_put(cache_key, content)
+
+    def generate_json_response(
+        self,
+        prompt: str,
+        system_role: str = "You are a helpful assistant.",
+        temperature: float = 0.2,
+        model: Optional[str] = None,
+        max_chars: Optional[int] = None,
+        memoize: bool = True
     ) -> Optional[str]:
+        """JSON object text from the model; "" if the model replied but the
+        reply was rejected (too long, no valid JSON), None if no call was made.
 
-        response = self.generate_response(prompt, system_role, temperature)
-        if not response:
+        ``max_chars`` rejects a longer raw reply up front, before any of the
+        parsing and cleanup below runs on it. Only replies that come out as
+        valid JSON are memoized; a caller that validates further passes
+        ``memoize=False`` and calls memoize() once the reply has passed.
+        """
+
+        if not self.client:
+            logger.warning("Groq client not initialized.")
             return None
 
-        try:
-            # Clean markdown if model adds it
-            cleaned = response.strip()
-            
-            # Remove markdown code blocks if present
-            if "```json" in cleaned:
-                cleaned = cleaned.split("```json")[1].split("```")[0].strip()
-            elif "```" in cleaned:
-                cleaned = cleaned.split("```")[1].split("```")[0].strip()
-            
-            # Use regex to find the first JSON object block if not already clean
-            json_match = re.search(r'\{.*\}', cleaned, re.DOTALL)
-            if json_match:
-                cleaned = json_match.group(0)
+        cache_key = self._memo_key(prompt, system_role, temperature, True, model or self.model_name)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = self.generate_response(
+            prompt, system_role, temperature, json_mode=True, model=model, use_memo=False
+        )
+        if response is None:
+            return None
+        if not response:
+            return ""
+
+        if max_chars is not None and len(response) > max_chars:
+            logger.warning(f"Groq reply exceeded {max_chars} characters; rejected before parsing.")
+            return ""
+
+        cleaned = _extract_json(response)
+        if cleaned is None:
+            logger.error(f"Invalid JSON returned from Groq. Raw Response: {response}")
+            return ""
+
+        if memoize:
+            _cache_put(cache_key, cleaned)
+        return cleaned
+
+    def memoize(
+        self,
+        reply: str,
+        prompt: str,
+        system_role: str = "You are a helpful assistant.",
+        temperature: float = 0.2,
+        json_mode: bool = False,
+        model: Optional[str] = None
+    ) -> None:
+        """Store a reply the caller has validated, under the key the same
+        call looks it up by."""
+        _cache_put(self._memo_key(prompt, system_role, temperature, json_mode, model or self.model_name), reply)
+
+    @staticmethod
+    def _memo_key(
+        prompt: str,
+        system_role: str,
+        temperature: float,
+        json_mode: bool,
+        model: str,
+        max_tokens: Optional[int] = None
+    ) -> tuple:
+        return (model, system_role, prompt, temperature, json_mode, max_tokens)
+
 
-            # Attempt to validate JSON
-            json.loads(cleaned)
+_llm_service: Optional[LLMService] = None
+
+
+def get_llm_service() -> LLMService:
+    """The process-wide LLMService every service shares (one client, one pool)."""
+    global _llm_service
+    if _llm_service is None:
+        with _client_lock:
+            if _llm_service is None:
+                _llm_service = LLMService()
+    return _llm_service
+
+
+def _extract_json(response: str) -> Optional[str]:
+    """The JSON object in a reply (markdown fences and common escaping slips
+    repaired), or None if there isn't a valid one."""
+
+    # Clean markdown if model adds it
+    cleaned = response.strip()
+
+    # Fast path: the reply is already a bare JSON object (always, in JSON
+    # mode, unless it was cut off), which the extraction below would return
+    # unchanged anyway; the fixups are only a fallback
+    if cleaned.startswith("{") and cleaned.endswith("}") and "```" not in cleaned:
+        try:
+            orjson.loads(cleaned)
             return cleaned
+        except orjson.JSONDecodeError:
+            pass
+
+    try:
+        # Remove markdown code blocks if present
+        if "```json" in cleaned:
+            cleaned = cleaned.split("```json")[1].split("```")[0].strip()
+        elif "```" in cleaned:
+            cleaned = cleaned.split("```")[1].split("```")[0].strip()
 
-        except json.JSONDecodeError:
-            # Attempt to fix common issues
+        # Find the first JSON object block if not already clean
+        json_match = _JSON_OBJECT_RE.search(cleaned)
+        if json_match:
+            cleaned = json_match.group(0)
+
+        # Attempt to validate JSON
+        orjson.loads(cleaned)
+        return cleaned
+
+    except orjson.JSONDecodeError:
+        # Attempt to fix common issues
+        try:
+            # 1. Fix invalid escape for single quotes (\' -> ')
+            fixed = cleaned.replace("\\'", "'")
+
+            # 2. Fix unescaped newlines (replace literal newline with \n char)
+            # We try to preserve structure by escaping them instead of removing
+            fixed = fixed.replace('\n', '\\n').replace('\r', '')
+
+            orjson.loads(fixed)
+            return fixed
+        except orjson.JSONDecodeError:
+            # If that fails, try the destructive newline removal (fallback)
             try:
-                # 1. Fix invalid escape for single quotes (\' -> ')
-                fixed = cleaned.replace("\\'", "'")
-                
-                # 2. Fix unescaped newlines (replace literal newline with \n char)
-                # We try to preserve structure by escaping them instead of removing
-                fixed = fixed.replace('\n', '\\n').replace('\r', '')
-                
-                json.loads(fixed)
+                fixed = cleaned.replace("\\'", "'").replace('\n', ' ').replace('\r', '')
+                orjson.loads(fixed)
                 return fixed
-            except:
-                # If that fails, try the destructive newline removal (fallback)
-                try:
-                    fixed = cleaned.replace("\\'", "'").replace('\n', ' ').replace('\r', '')
-                    json.loads(fixed)
-                    return fixed
-                except:
-                    pass
+            except orjson.JSONDecodeError:
+                pass
 
-            logger.error(f"Invalid JSON returned from Groq. Raw Response: {response}")
-            return None
+    return None
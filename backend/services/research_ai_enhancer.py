@@ -1,10 +1,11 @@
-import json
+import orjson
 import logging
 from typing import Dict, Any, List
-from .llm_service import LLMService
+from .llm_service import get_llm_service
+from ._logging import configure_once
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_once()
 logger = logging.getLogger(__name__)
 
 class ResearchAIEnhancer:
@@ -14,7 +15,7 @@ class ResearchAIEnhancer:
     """
 
     def __init__(self):
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
 
     def enhance_research(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -41,7 +42,8 @@ class ResearchAIEnhancer:
         try:
             response_json_str = self.llm_service.generate_json_response(
                 prompt=prompt,
-                system_role=system_role
+                system_role=system_role,
+                memoize=False
             )
 
             if not response_json_str:
@@ -53,7 +55,7 @@ class ResearchAIEnhancer:
                 return {"enhanced_cases": [], "most_influential_analysis": ["Error: AI response too large."]}
 
             try:
-                data = json.loads(response_json_str)
+                data = orjson.loads(response_json_str)
                 
                 # Deep validation
                 if not isinstance(data.get("enhanced_cases"), list):
@@ -69,9 +71,10 @@ class ResearchAIEnhancer:
                      logger.warning("Invalid format: 'most_influential_analysis' is not a list of strings.")
                      return {"enhanced_cases": [], "most_influential_analysis": ["Error: Invalid analysis format."]}
 
+                self.llm_service.memoize(response_json_str, prompt, system_role, json_mode=True)
                 return data
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error("Failed to decode JSON from LLM response.")
                 return {"enhanced_cases": [], "most_influential_analysis": ["Error: AI response parsing failed."]}
 
@@ -80,7 +83,11 @@ class ResearchAIEnhancer:
             return {"enhanced_cases": [], "most_influential_analysis": ["Error: internal system error."]}
 
     def _construct_prompt(self, data: Dict[str, Any]) -> str:
-        """Constructs the strict analysis prompt."""
+        """Constructs the strict analysis prompt.
+
+        Input and schema are serialized compactly: indentation only costs
+        prompt tokens (and prefill time), the model reads compact JSON fine.
+        """
         return f"""
 You are a legal research assistant.
 
@@ -91,9 +98,6 @@ STRICT RULES:
 - Do NOT invent citation counts.
 - Do NOT alter court or year.
 - Use only provided information.
-- Output must be valid JSON.
-- Do NOT include explanations outside JSON.
-- Do NOT include markdown formatting.
 - Return ONLY a JSON object.
 
 Your tasks:
@@ -105,17 +109,8 @@ Your tasks:
 2. Explain in 3 bullet points why the most_influential_case stands out compared to others.
 
 Input JSON:
-{json.dumps(data, indent=2)}
+{orjson.dumps(data).decode()}
 
 Output JSON format:
-{{
-  "enhanced_cases": [
-    {{
-      "case_name": "string",
-      "concise_holding": "string",
-      "influence_reason": "string"
-    }}
-  ],
-  "most_influential_analysis": ["string", "string", "string"]
-}}
+{{"enhanced_cases": [{{"case_name": "string", "concise_holding": "string", "influence_reason": "string"}}], "most_influential_analysis": ["string", "string", "string"]}}
 """
@@ -1,11 +1,55 @@
-import json
+import orjson
 import logging
+from string import Template
 from typing import Dict, Any
-from .llm_service import LLMService
+from .llm_service import get_llm_service
+from ._logging import configure_once
 
-logging.basicConfig(level=logging.INFO)
+configure_once()
 logger = logging.getLogger(__name__)
 
+_SYSTEM_ROLE = (
+    "You are a legal roadmap engine. HARD RULES: "
+    "1. ONLY use statutes listed in 'Laws' below. Do NOT invent or add any other statute. "
+    "2. issue_type is a HARD DOMAIN BOUNDARY. Do NOT cross into unrelated legal domains. "
+    "3. Max 2 bullets per section. Max 10 words per bullet. "
+    "4. Start each bullet with an action verb. "
+    "5. No adjectives, no qualifiers, no explanations. "
+    "6. FORBIDDEN words: consider, explore, potential, relevant, appropriate, ensure, necessary, applicable. "
+    "7. If issue_type is 'Motor Vehicle Accident', do NOT mention Consumer Protection, Environment, or Property law. "
+    "8. If issue_type is 'Consumer Protection', do NOT mention Motor Vehicles Act, criminal law, or property law. "
+    "9. Mirror the action_steps provided. Do NOT invent new strategies."
+)
+
+# Built once; only the case data is spliced in per call. Static instructions
+# come first, case data last: the shared prefix is what provider-side prompt
+# caching can reuse between calls.
+_PROMPT_TEMPLATE = Template("""
+Generate roadmap. Max 2 bullets per array. Max 10 words per bullet.
+
+ONLY output JSON:
+{
+  "roadmap": {
+    "immediate_actions": [],
+    "evidence_checklist": [],
+    "legal_notice_strategy": [],
+    "pre_litigation_options": [],
+    "litigation_strategy": [],
+    "estimated_timeline": "",
+    "cost_considerations": [],
+    "risk_assessment": [],
+    "escalation_path": []
+  }
+}
+
+Issue: $issue
+Laws: $laws
+Strength: $strength
+Action Steps Already Identified: $steps
+
+DOMAIN BOUNDARY: You may ONLY reference "$issue" domain and "$laws". Nothing else.
+""")
+
 
 class RoadmapGenerator:
     """
@@ -13,7 +57,7 @@ class RoadmapGenerator:
     """
 
     def __init__(self):
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
 
     @staticmethod
     def _compress_roadmap(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -24,12 +68,21 @@ class RoadmapGenerator:
         for key, val in roadmap.items():
             if isinstance(val, list):
                 roadmap[key] = [
-                    " ".join(item.split()[:12]).rstrip(".,;") + "."
-                    if len(item.split()) > 12 else item
+                    RoadmapGenerator._cap_words(item)
                     for item in val[:3]  # also cap at 3 items
                 ]
         return data
 
+    @staticmethod
+    def _cap_words(item: str, limit: int = 12) -> str:
+        """First ``limit`` words of ``item`` ending in ".", or ``item`` if short enough."""
+        # maxsplit stops scanning after limit + 1 words; only whether there
+        # is one more word than the cap matters
+        words = item.split(None, limit)
+        if len(words) <= limit:
+            return item
+        return " ".join(words[:limit]).rstrip(".,;") + "."
+
     def generate_roadmap(self, structured_analysis: Dict[str, Any]) -> Dict[str, Any]:
 
         required_keys = [
@@ -42,60 +95,27 @@ class RoadmapGenerator:
         if not all(k in structured_analysis for k in required_keys):
             return {"roadmap": ["Invalid structured analysis data."]}
 
-        system_role = (
-            "You are a legal roadmap engine. HARD RULES: "
-            "1. ONLY use statutes listed in 'Laws' below. Do NOT invent or add any other statute. "
-            "2. issue_type is a HARD DOMAIN BOUNDARY. Do NOT cross into unrelated legal domains. "
-            "3. Max 2 bullets per section. Max 10 words per bullet. "
-            "4. Start each bullet with an action verb. "
-            "5. No adjectives, no qualifiers, no explanations. "
-            "6. FORBIDDEN words: consider, explore, potential, relevant, appropriate, ensure, necessary, applicable. "
-            "7. If issue_type is 'Motor Vehicle Accident', do NOT mention Consumer Protection, Environment, or Property law. "
-            "8. If issue_type is 'Consumer Protection', do NOT mention Motor Vehicles Act, criminal law, or property law. "
-            "9. Mirror the action_steps provided. Do NOT invent new strategies."
+        prompt = _PROMPT_TEMPLATE.substitute(
+            issue=structured_analysis["issue_type"],
+            laws=", ".join(structured_analysis["relevant_sections"]),
+            strength=structured_analysis["legal_strength"],
+            steps=orjson.dumps(structured_analysis["action_steps"]).decode(),
         )
 
-        laws = ", ".join(structured_analysis["relevant_sections"])
-        issue = structured_analysis["issue_type"]
-        steps = json.dumps(structured_analysis["action_steps"])
-
-        prompt = f"""
-Issue: {issue}
-Laws: {laws}
-Strength: {structured_analysis["legal_strength"]}
-Action Steps Already Identified: {steps}
-
-DOMAIN BOUNDARY: You may ONLY reference "{issue}" domain and "{laws}". Nothing else.
-
-Generate roadmap. Max 2 bullets per array. Max 10 words per bullet.
-
-ONLY output JSON:
-{{
-  "roadmap": {{
-    "immediate_actions": [],
-    "evidence_checklist": [],
-    "legal_notice_strategy": [],
-    "pre_litigation_options": [],
-    "litigation_strategy": [],
-    "estimated_timeline": "",
-    "cost_considerations": [],
-    "risk_assessment": [],
-    "escalation_path": []
-  }}
-}}
-"""
-
         response = self.llm_service.generate_json_response(
             prompt=prompt,
-            system_role=system_role,
-            temperature=0.1
+            system_role=_SYSTEM_ROLE,
+            temperature=0.1,
+            memoize=False
         )
 
         if not response:
             return {"roadmap": ["Unable to generate roadmap."]}
 
         try:
-            result = json.loads(response)
-            return self._compress_roadmap(result)
+            roadmap = self._compress_roadmap(orjson.loads(response))
         except Exception:
             return {"roadmap": ["Invalid roadmap format."]}
+
+        self.llm_service.memoize(response, prompt, _SYSTEM_ROLE, temperature=0.1, json_mode=True)
+        return roadmap
@@ -1,22 +1,69 @@
-import json
 import logging
-from typing import Dict, Any
-from .llm_service import LLMService
+import threading
+from typing import Dict, Any, Optional, Tuple
+import orjson
+from .llm_service import get_llm_service
+from ._logging import configure_once
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_once()
 logger = logging.getLogger(__name__)
 
+# Cascade outcomes for short inputs: answered by the small model vs escalated
+_cascade_lock = threading.Lock()
+_cascade_hits = 0
+_cascade_escalations = 0
+
+
+def cascade_stats() -> dict:
+    """Current model-cascade statistics."""
+    with _cascade_lock:
+        total = _cascade_hits + _cascade_escalations
+        return {
+            "hits": _cascade_hits,
+            "escalations": _cascade_escalations,
+            "hit_rate": _cascade_hits / total if total else 0.0,
+        }
+
+
+def _record_cascade(ok: bool) -> None:
+    global _cascade_hits, _cascade_escalations
+    with _cascade_lock:
+        if ok:
+            _cascade_hits += 1
+        else:
+            _cascade_escalations += 1
+
+
 class Simplifier:
     """
     A service for simplifying complex legal summaries using an LLM.
     """
 
+    # Role, rules and output format never change, so they live in one system
+    # prompt; the user message carries only the summary
+    SYSTEM_PROMPT = (
+        "You are a helpful legal assistant. Your goal is to simplify complex legal language "
+        "into clear, concise, and layman-friendly explanations.\n"
+        "Rules: layman explanation, max 150 words; bullet points (•) separated by \\n; "
+        "preserve the original meaning; no markdown.\n"
+        "Return ONLY a JSON object {\"simplified_summary\": \"...\"} with properly escaped string values."
+    )
+
+    # Model cascade: inputs shorter than this go to the small model first
+    CASCADE_MODEL = "llama-3.1-8b-instant"
+    CASCADE_MAX_INPUT_CHARS = 1200
+
+    MAX_SUMMARY_CHARS = 2000
+    # Longest raw reply that can still decode to MAX_SUMMARY_CHARS (6-char
+    # \uXXXX escapes, plus the key and braces); longer ones aren't parsed
+    MAX_RAW_RESPONSE_CHARS = 6 * MAX_SUMMARY_CHARS + 64
+
     def __init__(self):
         """
-        Initializes the Simplifier with an instance of LLMService.
+        Initializes the Simplifier with the shared LLMService.
         """
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
 
     def simplify(self, legal_summary: str) -> Dict[str, str]:
         """
@@ -36,52 +83,62 @@ class Simplifier:
         if not legal_summary:
             return {"simplified_summary": "Error: No summary provided."}
 
-        system_role = (
-            "You are a helpful legal assistant. Your goal is to simplify complex legal language "
-            "into clear, concise, and layman-friendly explanations."
-        )
-
-        prompt = (
-            f"Please simplify the following legal summary:\n\n"
-            f"\"{legal_summary}\"\n\n"
-            f"Requirements:\n"
-            f"1. Generate a layman explanation.\n"
-            f"2. Limit the explanation to a maximum of 150 words.\n"
-            f"3. Use bullet points (•) and separate them with \\n.\n"
-            f"4. Preserve the original meaning.\n"
-            f"5. Do NOT include markdown.\n"
-            f"6. Do NOT include explanations outside JSON.\n"
-            f"7. Return ONLY a JSON object with the key 'simplified_summary'. Ensure the JSON string values are properly escaped."
-        )
+        prompt = f"Simplify this legal summary:\n\"{legal_summary}\""
 
         try:
-            response_json = self.llm_service.generate_json_response(prompt, system_role)
-            
-            if response_json:
-                try:
-                    data = json.loads(response_json)
-                    
-                    if "simplified_summary" not in data:
-                         logger.warning("LLM response missing 'simplified_summary' key.")
-                         return {"simplified_summary": "Error: Failed to process the summary format."}
-
-                    if not isinstance(data["simplified_summary"], str):
-                        logger.warning("LLM response 'simplified_summary' is not a string.")
-                        return {"simplified_summary": "Error: Invalid response type."}
-
-                    if len(data["simplified_summary"]) > 2000:
-                        logger.warning("Simplified summary exceeded 2000 characters.")
-                        return {"simplified_summary": "Error: Summary too long."}
-                    
-                    return data
-                    
-                except json.JSONDecodeError:
-                    logger.error("Failed to decode JSON from LLM response.")
-                    return {"simplified_summary": "Error: Failed to process the summary format."}
-            else:
-                logger.error("LLM service returned None.")
-                return {"simplified_summary": "Error: Unable to generate simplification from LLM."}
+            # Cascade: short summaries try the small model first and only go
+            # to the default model if its reply doesn't pass validation. Only
+            # calls the small model answered count towards the statistics.
+            if len(legal_summary) < self.CASCADE_MAX_INPUT_CHARS and self.llm_service.is_available():
+                result, ok = self._simplify_with(prompt, self.CASCADE_MODEL)
+                if ok is not None:
+                    _record_cascade(ok)
+                if ok:
+                    return result
+                logger.info("Small-model simplification failed; escalating to the default model.")
+
+            return self._simplify_with(prompt)[0]
 
         except Exception as e:
             logger.error(f"An error occurred during simplification: {str(e)}")
             return {"simplified_summary": "Error: An internal error occurred."}
+
+    def _simplify_with(self, prompt: str, model: Optional[str] = None) -> Tuple[Dict[str, str], Optional[bool]]:
+        """
+        Runs one simplification call and validates the reply.
+
+        Returns:
+            Tuple[Dict[str, str], Optional[bool]]: The result (or error message) and whether the reply
+                passed validation; None if the model did not reply at all.
+        """
+        response_json = self.llm_service.generate_json_response(
+            prompt, self.SYSTEM_PROMPT, model=model, max_chars=self.MAX_RAW_RESPONSE_CHARS, memoize=False
+        )
+
+        if response_json is None:
+            logger.error("LLM service returned None.")
+            return {"simplified_summary": "Error: Unable to generate simplification from LLM."}, None
+
+        if not response_json:
+            return {"simplified_summary": "Error: Failed to process the summary format."}, False
+
+        try:
+            data = orjson.loads(response_json)
+        except orjson.JSONDecodeError:
+            logger.error("Failed to decode JSON from LLM response.")
+            return {"simplified_summary": "Error: Failed to process the summary format."}, False
+
+        if "simplified_summary" not in data:
+            logger.warning("LLM response missing 'simplified_summary' key.")
+            return {"simplified_summary": "Error: Failed to process the summary format."}, False
+
+        if not isinstance(data["simplified_summary"], str):
+            logger.warning("LLM response 'simplified_summary' is not a string.")
+            return {"simplified_summary": "Error: Invalid response type."}, False
+
+        if len(data["simplified_summary"]) > self.MAX_SUMMARY_CHARS:
+            logger.warning("Simplified summary exceeded 2000 characters.")
+            return {"simplified_summary": "Error: Summary too long."}, False
+
+        self.llm_service.memoize(response_json, prompt, self.SYSTEM_PROMPT, json_mode=True, model=model)
+        return data, True
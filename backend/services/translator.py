@@ -1,10 +1,11 @@
-import json
+import orjson
 import logging
-from typing import Dict, Any
-from .llm_service import LLMService
+from typing import Dict, Any, Iterator
+from .llm_service import get_llm_service
+from ._logging import configure_once
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_once()
 logger = logging.getLogger(__name__)
 
 class Translator:
@@ -13,11 +14,41 @@ class Translator:
     Strictly preserves formatting and meaning.
     """
 
+    # Role, rules and output format never change, so they live in one system
+    # prompt; the user message carries only the language and the draft
+    SYSTEM_PROMPT = (
+        "You are an expert legal translator. Your task is to translate legal documents accurately "
+        "while strictly preserving the original structure, formatting (markdown, bullet points, indentation), "
+        "and legal terminology.\n"
+        "Rules: translate accurately into the requested language; keep the exact original formatting "
+        "(markdown, bolding, lists); preserve the legal meaning and tone.\n"
+        "Return ONLY a JSON object: {\"translated_text\": \"<your translated text here>\"}"
+    )
+
+    # Streaming variant: same role and rules, but a bare-text reply, so every
+    # chunk can be passed on as soon as it arrives (no JSON to wait for)
+    STREAM_SYSTEM_PROMPT = (
+        "You are an expert legal translator. Your task is to translate legal documents accurately "
+        "while strictly preserving the original structure, formatting (markdown, bullet points, indentation), "
+        "and legal terminology.\n"
+        "Rules: translate accurately into the requested language; keep the exact original formatting "
+        "(markdown, bolding, lists); preserve the legal meaning and tone.\n"
+        "Reply with ONLY the translated text: no JSON, no backticks, no notes before or after it."
+    )
+
+    MAX_TRANSLATION_CHARS = 20000
+    # Separates a trailing error from partial streamed text
+    _INCOMPLETE_MARKER = "\n\n"
+    # Longest raw reply that can still decode to MAX_TRANSLATION_CHARS: every
+    # character may arrive as a 6-char \uXXXX escape, plus the key and braces.
+    # Anything longer is rejected without being parsed.
+    MAX_RAW_RESPONSE_CHARS = 6 * MAX_TRANSLATION_CHARS + 64
+
     def __init__(self):
         """
-        Initializes the Translator with an instance of LLMService.
+        Initializes the Translator with the shared LLMService.
         """
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
 
     def translate(self, legal_draft: str, target_language: str) -> Dict[str, str]:
         """
@@ -40,34 +71,15 @@ class Translator:
         legal_draft = legal_draft.strip()
         target_language = target_language.strip()
 
-        system_role = (
-            "You are an expert legal translator. Your task is to translate legal documents accurately "
-            "while strictly preserving the original structure, formatting (markdown, bullet points, indentation), "
-            "and legal terminology."
-        )
-
-        prompt = (
-            f"Please translate the following legal draft into {target_language}:\n\n"
-            f"{legal_draft}\n\n"
-            f"Strict Requirements:\n"
-            f"1. Translate the text accurately into {target_language}.\n"
-            f"2. Maintain the exact original formatting (markdown, bolding, lists, etc.).\n"
-            f"3. Preserve the legal meaning and tone.\n"
-            f"4. Do NOT include explanations outside JSON.\n"
-            f"5. Do NOT include markdown formatting.\n"
-            f"6. Return ONLY a JSON object.\n"
-            f"7. Do NOT wrap JSON in backticks.\n"
-            f"8. Output ONLY valid JSON in the following format:\n"
-            f"   {{\n"
-            f"       \"translated_text\": \"<your translated text here>\"\n"
-            f"   }}"
-        )
+        prompt = f"Translate to {target_language}:\n{legal_draft}"
 
         try:
             # Call the LLM service to generate a JSON response
             response_json_str = self.llm_service.generate_json_response(
                 prompt=prompt,
-                system_role=system_role
+                system_role=self.SYSTEM_PROMPT,
+                max_chars=self.MAX_RAW_RESPONSE_CHARS,
+                memoize=False
             )
 
             if not response_json_str:
@@ -76,7 +88,7 @@ class Translator:
 
             # Parse the JSON string
             try:
-                data = json.loads(response_json_str)
+                data = orjson.loads(response_json_str)
                 
                 # Validation: Ensure the key exists
                 if "translated_text" not in data:
@@ -87,16 +99,71 @@ class Translator:
                     logger.error("Invalid response type: 'translated_text' is not a string.")
                     return {"translated_text": "Error: Invalid response type."}
 
-                if len(data["translated_text"]) > 20000:
+                if len(data["translated_text"]) > self.MAX_TRANSLATION_CHARS:
                     logger.error("Translated text exceeded 20000 characters.")
                     return {"translated_text": "Error: Translation too long."}
-                
+
+                self.llm_service.memoize(response_json_str, prompt, self.SYSTEM_PROMPT, json_mode=True)
                 return data
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"JSON Decode Error: {e}. Output was: {response_json_str}")
                 return {"translated_text": "Error: Failed to process the translated text."}
 
         except Exception as e:
             logger.error(f"Unexpected error in Translator.translate: {str(e)}")
             return {"translated_text": "Error: An unexpected system error occurred during translation."}
+
+    def translate_stream(self, legal_draft: str, target_language: str) -> Iterator[str]:
+        """
+        Streams the translation of the provided legal draft as it is generated.
+
+        Args:
+            legal_draft (str): The structured legal draft to be translated.
+            target_language (str): The target language (e.g., "Hindi", "French").
+
+        Yields:
+            str: Successive pieces of the translated text. Failures yield the
+                 same error messages as translate(); if the translation breaks
+                 off after some text was sent (provider error, length cap), a
+                 trailing error line marks it as incomplete.
+        """
+        if not isinstance(legal_draft, str) or not legal_draft.strip():
+            yield "Error: No legal draft provided for translation."
+            return
+
+        if not isinstance(target_language, str) or not target_language.strip():
+            yield "Error: No target language specified."
+            return
+
+        if not self.llm_service.is_available():
+            logger.error("LLM Service unavailable for streaming translation.")
+            yield "Error: Failed to generate translation. Please try again."
+            return
+
+        prompt = f"Translate to {target_language.strip()}:\n{legal_draft.strip()}"
+
+        produced = 0
+        try:
+            for piece in self.llm_service.generate_response_stream(
+                prompt=prompt,
+                system_role=self.STREAM_SYSTEM_PROMPT
+            ):
+                produced += len(piece)
+                if produced > self.MAX_TRANSLATION_CHARS:
+                    logger.error("Translated text exceeded 20000 characters.")
+                    sent = produced - len(piece)
+                    yield (self._INCOMPLETE_MARKER if sent else "") + "Error: Translation too long."
+                    return
+                yield piece
+        except Exception as e:
+            logger.error(f"Unexpected error in Translator.translate_stream: {str(e)}")
+            if produced:
+                yield self._INCOMPLETE_MARKER + "Error: Translation interrupted; the text above is incomplete."
+            else:
+                yield "Error: Failed to generate translation. Please try again."
+            return
+
+        if not produced:
+            logger.error("LLM Service returned no response for translation.")
+            yield "Error: Failed to generate translation. Please try again."
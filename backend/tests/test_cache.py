@@ -0,0 +1,43 @@
+import threading
+import unittest
+from unittest import mock
+
+from app.services import cache as cache_module
+from app.services.cache import LegalCache
+
+
+class LegalCacheConcurrencyTest(unittest.TestCase):
+    """The search and empower routes hit the shared cache from worker threads."""
+
+    def test_concurrent_get_set_and_sweep(self):
+        cache = LegalCache()
+        errors: list[BaseException] = []
+        start = threading.Barrier(8)
+
+        def worker(n: int) -> None:
+            try:
+                start.wait()
+                for i in range(3000):
+                    key = f"q{(n * 7 + i) % 40}"
+                    cache.set_query(key, i)
+                    cache.get_query(key)
+                    cache.get_query(f"q{i % 40}")
+            except BaseException as exc:   # noqa: BLE001 — surfaced below
+                errors.append(exc)
+
+        # Sweep on every write and keep the store small, so evictions, LRU
+        # moves and sweeps all interleave across threads
+        with mock.patch.object(cache_module, "CACHE_SWEEP_INTERVAL", 1), \
+                mock.patch.object(cache_module, "CACHE_MAX_QUERY_ENTRIES", 16):
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(cache.stats["query_entries"], 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
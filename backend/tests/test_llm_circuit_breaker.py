@@ -0,0 +1,115 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+from groq import APITimeoutError, BadRequestError, InternalServerError
+
+from services import llm_service
+from services.llm_service import CircuitBreaker, LLMService
+
+_REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+
+
+def _status_error(cls, status: int):
+    return cls("error", response=httpx.Response(status, request=_REQUEST), body=None)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(llm_service.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(fail_max=3, reset_timeout=30.0)
+
+    def _fail(self, times: int) -> None:
+        for _ in range(times):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_failure()
+
+    def test_opens_after_fail_max_consecutive_failures(self):
+        self._fail(2)
+        self.assertFalse(self.breaker.is_open())
+        self._fail(1)
+        self.assertTrue(self.breaker.is_open())
+        self.assertFalse(self.breaker.allow())
+
+    def test_success_resets_the_failure_count(self):
+        self._fail(2)
+        self.breaker.record_success()
+        self._fail(2)
+        self.assertFalse(self.breaker.is_open())
+
+    def test_half_open_lets_one_trial_through(self):
+        self._fail(3)
+        self.now += 30.0
+        self.assertFalse(self.breaker.is_open())   # peeking doesn't claim the trial
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())     # trial in flight
+        self.assertTrue(self.breaker.is_open())
+
+    def test_successful_trial_closes(self):
+        self._fail(3)
+        self.now += 30.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertFalse(self.breaker.is_open())
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_trial_reopens_for_another_reset_timeout(self):
+        self._fail(3)
+        self.now += 30.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+        self.now += 29.0
+        self.assertFalse(self.breaker.allow())
+        self.now += 1.0
+        self.assertTrue(self.breaker.allow())
+
+    def test_fail_max_zero_disables(self):
+        breaker = CircuitBreaker(fail_max=0)
+        for _ in range(10):
+            breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.is_open())
+
+
+class LLMServiceBreakerTest(unittest.TestCase):
+    """Only provider-health errors count towards opening the shared breaker."""
+
+    def setUp(self):
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=30.0)
+        for target, value in (("_circuit_breaker", breaker), ("_CACHE_TTL_SECONDS", 0)):
+            patcher = mock.patch.object(llm_service, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.breaker = breaker
+        self.service = LLMService.__new__(LLMService)
+        self.service.model_name = "test-model"
+
+    def _raise(self, exc: Exception) -> None:
+        create = mock.Mock(side_effect=exc)
+        self.service.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        with self.assertLogs(llm_service.logger, "ERROR"):
+            self.assertIsNone(self.service.generate_response("prompt"))
+
+    def test_bad_requests_do_not_open_the_breaker(self):
+        for _ in range(5):
+            self._raise(_status_error(BadRequestError, 400))
+        self.assertFalse(self.breaker.is_open())
+
+    def test_server_errors_and_timeouts_open_the_breaker(self):
+        self._raise(_status_error(InternalServerError, 503))
+        self._raise(APITimeoutError(request=_REQUEST))
+        self.assertTrue(self.breaker.is_open())
+        self.assertFalse(self.service.is_available())
+
+
+if __name__ == "__main__":
+    unittest.main()
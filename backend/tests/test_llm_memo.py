@@ -0,0 +1,50 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from services import llm_service
+from services.llm_service import LLMService
+from services.simplifier import Simplifier
+
+
+class ResponseMemoTest(unittest.TestCase):
+    """Only replies that pass validation are kept in the response memo."""
+
+    def setUp(self):
+        for target, value in (("_cache", llm_service.OrderedDict()), ("_CACHE_TTL_SECONDS", 3600)):
+            patcher = mock.patch.object(llm_service, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.service = LLMService.__new__(LLMService)
+        self.service.model_name = "test-model"
+        self.replies: list[str] = []
+        self.create = mock.Mock(side_effect=lambda **kw: SimpleNamespace(choices=[SimpleNamespace(
+            finish_reason="stop", message=SimpleNamespace(content=self.replies.pop(0)),
+        )]))
+        self.service.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        )
+
+    def test_invalid_json_is_not_memoized(self):
+        self.replies = ["not json", '{"a": 1}']
+        with self.assertLogs(llm_service.logger, "ERROR"):
+            self.assertEqual(self.service.generate_json_response("p"), "")
+        self.assertEqual(self.service.generate_json_response("p"), '{"a": 1}')
+        self.assertEqual(self.service.generate_json_response("p"), '{"a": 1}')
+        self.assertEqual(self.create.call_count, 2)
+
+    def test_reply_rejected_by_the_caller_is_not_memoized(self):
+        simplifier = Simplifier.__new__(Simplifier)
+        simplifier.llm_service = self.service
+        too_long = '{"simplified_summary": "%s"}' % ("x" * 2500)
+        self.replies = [too_long, '{"simplified_summary": "ok"}']
+        with self.assertLogs("services.simplifier", "WARNING"):
+            _, ok = simplifier._simplify_with("p")
+        self.assertFalse(ok)
+        self.assertEqual(simplifier._simplify_with("p"), ({"simplified_summary": "ok"}, True))
+        self.assertEqual(simplifier._simplify_with("p"), ({"simplified_summary": "ok"}, True))
+        self.assertEqual(self.create.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from services import llm_service, simplifier
+from services.llm_service import LLMService
+from services.simplifier import Simplifier
+
+
+class SimplifierCascadeTest(unittest.TestCase):
+    """Escalations are counted only for small-model replies that fail validation."""
+
+    def setUp(self):
+        for module, target, value in (
+            (llm_service, "_cache", llm_service.OrderedDict()),
+            (llm_service, "_circuit_breaker", llm_service.CircuitBreaker()),
+            (simplifier, "_cascade_hits", 0),
+            (simplifier, "_cascade_escalations", 0),
+        ):
+            patcher = mock.patch.object(module, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        service = LLMService.__new__(LLMService)
+        service.model_name = "test-model"
+        self.replies: list = []
+        self.create = mock.Mock(side_effect=self._reply)
+        service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=self.create)))
+        self.simplifier = Simplifier.__new__(Simplifier)
+        self.simplifier.llm_service = service
+
+    def _reply(self, **kwargs):
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return SimpleNamespace(choices=[SimpleNamespace(
+            finish_reason="stop", message=SimpleNamespace(content=reply),
+        )])
+
+    def test_small_model_hit(self):
+        self.replies = ['{"simplified_summary": "ok"}']
+        self.assertEqual(self.simplifier.simplify("short"), {"simplified_summary": "ok"})
+        self.assertEqual(self.create.call_args.kwargs["model"], Simplifier.CASCADE_MODEL)
+        self.assertEqual(simplifier.cascade_stats()["hits"], 1)
+
+    def test_invalid_reply_escalates_and_counts(self):
+        self.replies = ["not json", '{"simplified_summary": "ok"}']
+        with self.assertLogs(llm_service.logger, "ERROR"):
+            self.assertEqual(self.simplifier.simplify("short"), {"simplified_summary": "ok"})
+        self.assertEqual(self.create.call_args.kwargs["model"], "test-model")
+        self.assertEqual(simplifier.cascade_stats()["escalations"], 1)
+
+    def test_no_reply_escalates_without_counting(self):
+        self.replies = [RuntimeError("boom"), '{"simplified_summary": "ok"}']
+        with self.assertLogs(llm_service.logger, "ERROR"):
+            self.assertEqual(self.simplifier.simplify("short"), {"simplified_summary": "ok"})
+        self.assertEqual(simplifier.cascade_stats(), {"hits": 0, "escalations": 0, "hit_rate": 0.0})
+
+    def test_unavailable_service_skips_the_cascade(self):
+        self.replies = ['{"simplified_summary": "ok"}']
+        with mock.patch.object(LLMService, "is_available", return_value=False):
+            self.simplifier.simplify("short")
+        self.assertEqual(self.create.call_count, 1)
+        self.assertEqual(self.create.call_args.kwargs["model"], "test-model")
+        self.assertEqual(simplifier.cascade_stats()["escalations"], 0)
+
+if __name__ == "__main__":
+    unittest.main()